@@ -1,8 +1,10 @@
 """The Pianobar integration."""
 from __future__ import annotations
 
+from collections.abc import Awaitable
+from functools import partial
 import logging
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
@@ -42,20 +44,160 @@ from .coordinator import PianobarCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.MEDIA_PLAYER, Platform.SELECT]
+PLATFORMS: Final = (Platform.MEDIA_PLAYER, Platform.SELECT)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# Seed kinds accepted by station.deleteSeed (mirrors services.yaml options)
+_SEED_TYPES = ("artist", "song", "station")
+
+# Shared service schemas, compiled once at import
+_SCHEMA_EMPTY = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+})
+
+_SCHEMA_STATION_ID = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Required("station_id"): cv.string,
+})
+
+_SCHEMA_CREATE_STATION = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Optional("type", default="song"): cv.string,
+})
+
+_SCHEMA_RENAME_STATION = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Required("station_id"): cv.string,
+    vol.Required("name"): cv.string,
+})
+
+_SCHEMA_SET_QUICK_MIX = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Required("station_ids"): [cv.string],
+})
+
+_SCHEMA_ADD_SEED = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Required("music_id"): cv.string,
+    vol.Required("station_id"): cv.string,
+})
+
+_SCHEMA_DELETE_SEED = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Required("seed_id"): cv.string,
+    vol.Required("seed_type"): vol.In(_SEED_TYPES),
+    vol.Required("station_id"): cv.string,
+})
+
+_SCHEMA_DELETE_FEEDBACK = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Required("feedback_id"): cv.string,
+    vol.Required("station_id"): cv.string,
+})
+
+_SCHEMA_SET_STATION_MODE = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Required("station_id"): cv.string,
+    vol.Required("mode_id"): vol.Coerce(int),
+})
+
+_SCHEMA_MUSIC_ID = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Required("music_id"): cv.string,
+})
+
+_SCHEMA_SEARCH = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Required("query"): cv.string,
+})
+
+_SCHEMA_SWITCH_ACCOUNT = vol.Schema({
+    vol.Optional("entity_id"): cv.entity_ids,
+    vol.Required("account_id"): cv.string,
+})
+
+# Services that only forward a fixed action to the backend
+_ACTION_SERVICES: tuple[tuple[str, str], ...] = (
+    (SERVICE_LOVE_SONG, "song.love"),
+    (SERVICE_BAN_SONG, "song.ban"),
+    (SERVICE_TIRED_OF_SONG, "song.tired"),
+    (SERVICE_TOGGLE_PLAYBACK, "playback.toggle"),
+    (SERVICE_RESET_VOLUME, "volume.reset"),
+)
+
+# Services that forward call data to a backend event.
+# Payload is either {wire key: call data key} or a single call data key sent as-is.
+_EVENT_SERVICES: tuple[tuple[str, str, dict[str, str] | str, vol.Schema], ...] = (
+    (
+        SERVICE_RENAME_STATION,
+        "station.rename",
+        {"stationId": "station_id", "newName": "name"},
+        _SCHEMA_RENAME_STATION,
+    ),
+    (
+        SERVICE_DELETE_STATION,
+        "station.delete",
+        "station_id",
+        _SCHEMA_STATION_ID,
+    ),
+    (
+        SERVICE_SET_QUICK_MIX,
+        "station.setQuickMix",
+        "station_ids",
+        _SCHEMA_SET_QUICK_MIX,
+    ),
+    (
+        SERVICE_ADD_SEED,
+        "station.addMusic",
+        {"musicId": "music_id", "stationId": "station_id"},
+        _SCHEMA_ADD_SEED,
+    ),
+    (
+        SERVICE_DELETE_SEED,
+        "station.deleteSeed",
+        {"seedId": "seed_id", "seedType": "seed_type", "stationId": "station_id"},
+        _SCHEMA_DELETE_SEED,
+    ),
+    (
+        SERVICE_DELETE_FEEDBACK,
+        "station.deleteFeedback",
+        {"feedbackId": "feedback_id", "stationId": "station_id"},
+        _SCHEMA_DELETE_FEEDBACK,
+    ),
+    (
+        SERVICE_SET_STATION_MODE,
+        "station.setMode",
+        {"stationId": "station_id", "modeId": "mode_id"},
+        _SCHEMA_SET_STATION_MODE,
+    ),
+    (
+        SERVICE_CREATE_STATION_FROM_MUSIC_ID,
+        "station.addGenre",
+        {"musicId": "music_id"},
+        _SCHEMA_MUSIC_ID,
+    ),
+    (
+        SERVICE_ADD_SHARED_STATION,
+        "station.addShared",
+        {"stationId": "station_id"},
+        _SCHEMA_STATION_ID,
+    ),
+)
+
 
 def _get_coordinator_from_call(
     hass: HomeAssistant,
     call: ServiceCall
 ) -> PianobarCoordinator:
     """Get coordinator from service call target or default to first instance."""
+    # Resolve the per-entry coordinator map once for the whole call
+    coordinators: dict[str, PianobarCoordinator] = hass.data.get(DOMAIN) or {}
+
     # Extract entity_id - HA puts it in call.data when using targets
     entity_id = call.data.get("entity_id")
     
-    if entity_id:
+    if entity_id and coordinators:
         # Handle both single entity and list
         if isinstance(entity_id, list):
             entity_id = entity_id[0]
@@ -65,15 +207,14 @@ def _get_coordinator_from_call(
         entity_entry = entity_registry.async_get(entity_id)
         
         if entity_entry and entity_entry.config_entry_id:
-            coordinator = hass.data[DOMAIN].get(entity_entry.config_entry_id)
+            coordinator = coordinators.get(entity_entry.config_entry_id)
             if coordinator:
                 return coordinator
     
-    # Fallback: use first available instance
-    if DOMAIN in hass.data and hass.data[DOMAIN]:
-        entry_ids = list(hass.data[DOMAIN].keys())
-        if entry_ids:
-            return hass.data[DOMAIN][entry_ids[0]]
+    # Fallback: use first available instance (no intermediate key list)
+    coordinator = next(iter(coordinators.values()), None)
+    if coordinator is not None:
+        return coordinator
     
     raise ServiceValidationError(
         "No pianobar instance found",
@@ -82,63 +223,70 @@ def _get_coordinator_from_call(
     )
 
 
-async def async_setup(hass: HomeAssistant, config: dict) -> bool:
-    """Set up the Pianobar component (register domain-level services)."""
-    
-    async def async_love_song(call: ServiceCall) -> None:
-        """Handle love_song service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        await coordinator.send_action("song.love")
-
-    async def async_ban_song(call: ServiceCall) -> None:
-        """Handle ban_song service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        await coordinator.send_action("song.ban")
-
-    async def async_tired_of_song(call: ServiceCall) -> None:
-        """Handle tired_of_song service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        await coordinator.send_action("song.tired")
-
-    async def async_create_station(call: ServiceCall) -> None:
+async def _async_request(
+    coordinator: PianobarCoordinator, response_key: str, request: Awaitable[None]
+) -> Any:
+    """Send a request and return the backend's response for response_key.
+
+    The response is expected before the request is sent so a fast reply
+    cannot arrive before anything is listening for it.
+    """
+    response = coordinator.expect_response(response_key)
+    await request
+    return await coordinator.async_await_response(response)
+
+
+async def _async_handle_action_service(
+    hass: HomeAssistant, action: str, call: ServiceCall
+) -> None:
+    """Handle a service call that maps to a fixed backend action."""
+    coordinator = _get_coordinator_from_call(hass, call)
+    await coordinator.send_action(action)
+
+
+async def _async_handle_event_service(
+    hass: HomeAssistant,
+    event_name: str,
+    payload_fields: dict[str, str] | str,
+    call: ServiceCall,
+) -> None:
+    """Handle a service call that maps call data onto a backend event."""
+    coordinator = _get_coordinator_from_call(hass, call)
+    if isinstance(payload_fields, str):
+        payload = call.data.get(payload_fields)
+    else:
+        payload = {
+            wire_key: call.data.get(data_key)
+            for wire_key, data_key in payload_fields.items()
+        }
+    await coordinator.send_event(event_name, payload)
+
+
+class PianobarServices:
+    """Domain-level service handlers that need more than a table entry."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+
+    async def async_create_station(self, call: ServiceCall) -> None:
         """Handle create_station service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
+        coordinator = _get_coordinator_from_call(self.hass, call)
         station_type = call.data.get("type", "song")
         track_token = coordinator.data.get("song", {}).get("trackToken")
-        
+
         if not track_token:
             _LOGGER.error("No track token available")
             return
-            
+
         await coordinator.send_event(
             "station.createFrom",
             {"trackToken": track_token, "type": station_type}
         )
 
-    async def async_rename_station(call: ServiceCall) -> None:
-        """Handle rename_station service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        station_id = call.data.get("station_id")
-        new_name = call.data.get("name")
-        
-        await coordinator.send_event(
-            "station.rename",
-            {"stationId": station_id, "newName": new_name}
-        )
-
-    async def async_delete_station(call: ServiceCall) -> None:
-        """Handle delete_station service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        station_id = call.data.get("station_id")
-        
-        await coordinator.send_event(
-            "station.delete",
-            station_id
-        )
-
-    async def async_reconnect(call: ServiceCall) -> None:
+    async def async_reconnect(self, call: ServiceCall) -> None:
         """Handle reconnect service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
+        coordinator = _get_coordinator_from_call(self.hass, call)
         if not coordinator.is_connected:
             try:
                 await coordinator.async_connect()
@@ -148,389 +296,164 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         else:
             _LOGGER.info("Already connected to Pianobar")
 
-    async def async_explain_song(call: ServiceCall) -> dict[str, Any]:
+    async def async_explain_song(self, call: ServiceCall) -> dict[str, Any]:
         """Handle explain_song service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        await coordinator.send_action("song.explain")
-        explanation = await coordinator.wait_for_response("song_explanation")
+        coordinator = _get_coordinator_from_call(self.hass, call)
+        explanation = await _async_request(
+            coordinator, "song_explanation", coordinator.send_action("song.explain")
+        )
         return {"explanation": explanation or ""}
 
-    async def async_get_upcoming(call: ServiceCall) -> dict[str, Any]:
+    async def async_get_upcoming(self, call: ServiceCall) -> dict[str, Any]:
         """Handle get_upcoming service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        await coordinator.send_action("query.upcoming")
-        upcoming = await coordinator.wait_for_response("upcoming")
-        return {"songs": upcoming or []}
-
-    async def async_set_quick_mix(call: ServiceCall) -> None:
-        """Handle set_quick_mix service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        station_ids = call.data.get("station_ids", [])
-        await coordinator.send_event("station.setQuickMix", station_ids)
-
-    async def async_add_seed(call: ServiceCall) -> None:
-        """Handle add_seed service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        music_id = call.data.get("music_id")
-        station_id = call.data.get("station_id")
-        
-        await coordinator.send_event(
-            "station.addMusic",
-            {"musicId": music_id, "stationId": station_id}
+        coordinator = _get_coordinator_from_call(self.hass, call)
+        upcoming = await _async_request(
+            coordinator, "upcoming", coordinator.send_action("query.upcoming")
         )
+        return {"songs": upcoming or []}
 
-    async def async_get_station_info(call: ServiceCall) -> dict[str, Any]:
+    async def async_get_station_info(self, call: ServiceCall) -> dict[str, Any]:
         """Handle get_station_info service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        station_id = call.data.get("station_id")
-        
-        await coordinator.send_event(
-            "station.getInfo",
-            {"stationId": station_id}
-        )
-        station_info = await coordinator.wait_for_response("station_info")
-        return station_info or {}
-
-    async def async_delete_seed(call: ServiceCall) -> None:
-        """Handle delete_seed service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        seed_id = call.data.get("seed_id")
-        seed_type = call.data.get("seed_type")
+        coordinator = _get_coordinator_from_call(self.hass, call)
         station_id = call.data.get("station_id")
-        
-        await coordinator.send_event(
-            "station.deleteSeed",
-            {"seedId": seed_id, "seedType": seed_type, "stationId": station_id}
-        )
 
-    async def async_delete_feedback(call: ServiceCall) -> None:
-        """Handle delete_feedback service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        feedback_id = call.data.get("feedback_id")
-        station_id = call.data.get("station_id")
-        
-        await coordinator.send_event(
-            "station.deleteFeedback",
-            {"feedbackId": feedback_id, "stationId": station_id}
+        station_info = await _async_request(
+            coordinator,
+            "station_info",
+            coordinator.send_event("station.getInfo", {"stationId": station_id}),
         )
+        return station_info or {}
 
-    async def async_get_station_modes(call: ServiceCall) -> dict[str, Any]:
+    async def async_get_station_modes(self, call: ServiceCall) -> dict[str, Any]:
         """Handle get_station_modes service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
+        coordinator = _get_coordinator_from_call(self.hass, call)
         station_id = call.data.get("station_id")
-        
-        await coordinator.send_event(
-            "station.getModes",
-            {"stationId": station_id}
-        )
-        modes = await coordinator.wait_for_response("station_modes")
-        return {"modes": modes or []}
 
-    async def async_set_station_mode(call: ServiceCall) -> None:
-        """Handle set_station_mode service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        station_id = call.data.get("station_id")
-        mode_id = call.data.get("mode_id")
-        
-        await coordinator.send_event(
-            "station.setMode",
-            {"stationId": station_id, "modeId": mode_id}
+        modes = await _async_request(
+            coordinator,
+            "station_modes",
+            coordinator.send_event("station.getModes", {"stationId": station_id}),
         )
+        return {"modes": modes or []}
 
-    async def async_toggle_playback(call: ServiceCall) -> None:
-        """Handle toggle_playback service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        await coordinator.send_action("playback.toggle")
-
-    async def async_reset_volume(call: ServiceCall) -> None:
-        """Handle reset_volume service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        await coordinator.send_action("volume.reset")
-
-    async def async_search(call: ServiceCall) -> dict[str, Any]:
+    async def async_search(self, call: ServiceCall) -> dict[str, Any]:
         """Handle search service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
+        coordinator = _get_coordinator_from_call(self.hass, call)
         query = call.data.get("query")
-        
-        await coordinator.send_event(
-            "music.search",
-            {"query": query}
+
+        search_results = await _async_request(
+            coordinator,
+            "search_results",
+            coordinator.send_event("music.search", {"query": query}),
         )
-        search_results = await coordinator.wait_for_response("search_results")
         return search_results or {"categories": []}
 
-    async def async_get_genres(call: ServiceCall) -> dict[str, Any]:
+    async def async_get_genres(self, call: ServiceCall) -> dict[str, Any]:
         """Handle get_genres service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        
-        await coordinator.send_event(
-            "station.getGenres",
-            {}
+        coordinator = _get_coordinator_from_call(self.hass, call)
+        genres = await _async_request(
+            coordinator, "genres", coordinator.send_event("station.getGenres", {})
         )
-        genres = await coordinator.wait_for_response("genres")
         return genres or {"categories": []}
 
-    async def async_create_station_from_music_id(call: ServiceCall) -> None:
-        """Handle create_station_from_music_id service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        music_id = call.data.get("music_id")
-        
-        await coordinator.send_event(
-            "station.addGenre",
-            {"musicId": music_id}
-        )
-
-    async def async_add_shared_station(call: ServiceCall) -> None:
-        """Handle add_shared_station service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        station_id = call.data.get("station_id")
-        
-        await coordinator.send_event(
-            "station.addShared",
-            {"stationId": station_id}
-        )
-
-    async def async_switch_account(call: ServiceCall) -> None:
+    async def async_switch_account(self, call: ServiceCall) -> None:
         """Handle switch_account service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
+        coordinator = _get_coordinator_from_call(self.hass, call)
         account_id = call.data.get("account_id")
         await coordinator.send_action_with_params(
             "app.pandora-reconnect", {"account_id": account_id}
         )
         _LOGGER.info("Switching Pandora account to: %s", account_id)
 
-    # Register all services (done once at domain level)
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_LOVE_SONG,
-        async_love_song,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-        }),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_BAN_SONG,
-        async_ban_song,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-        }),
-    )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_TIRED_OF_SONG,
-        async_tired_of_song,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-        }),
-    )
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up the Pianobar component (register domain-level services)."""
+    services = PianobarServices(hass)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CREATE_STATION,
-        async_create_station,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Optional("type", default="song"): cv.string,
-        }),
-    )
+    # Register all services (done once at domain level)
+    for service, action in _ACTION_SERVICES:
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            partial(_async_handle_action_service, hass, action),
+            schema=_SCHEMA_EMPTY,
+        )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RENAME_STATION,
-        async_rename_station,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("station_id"): cv.string,
-            vol.Required("name"): cv.string,
-        }),
-    )
+    for service, event_name, payload_fields, schema in _EVENT_SERVICES:
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            partial(_async_handle_event_service, hass, event_name, payload_fields),
+            schema=schema,
+        )
 
     hass.services.async_register(
         DOMAIN,
-        SERVICE_DELETE_STATION,
-        async_delete_station,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("station_id"): cv.string,
-        }),
+        SERVICE_CREATE_STATION,
+        services.async_create_station,
+        schema=_SCHEMA_CREATE_STATION,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_RECONNECT,
-        async_reconnect,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-        }),
+        services.async_reconnect,
+        schema=_SCHEMA_EMPTY,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_EXPLAIN_SONG,
-        async_explain_song,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-        }),
+        services.async_explain_song,
+        schema=_SCHEMA_EMPTY,
         supports_response="optional",
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_UPCOMING,
-        async_get_upcoming,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-        }),
+        services.async_get_upcoming,
+        schema=_SCHEMA_EMPTY,
         supports_response="optional",
     )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_QUICK_MIX,
-        async_set_quick_mix,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("station_ids"): [cv.string],
-        }),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ADD_SEED,
-        async_add_seed,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("music_id"): cv.string,
-            vol.Required("station_id"): cv.string,
-        }),
-    )
-
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_STATION_INFO,
-        async_get_station_info,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("station_id"): cv.string,
-        }),
+        services.async_get_station_info,
+        schema=_SCHEMA_STATION_ID,
         supports_response="optional",
     )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DELETE_SEED,
-        async_delete_seed,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("seed_id"): cv.string,
-            vol.Required("seed_type"): vol.In(["artist", "song", "station"]),
-            vol.Required("station_id"): cv.string,
-        }),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DELETE_FEEDBACK,
-        async_delete_feedback,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("feedback_id"): cv.string,
-            vol.Required("station_id"): cv.string,
-        }),
-    )
-
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_STATION_MODES,
-        async_get_station_modes,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("station_id"): cv.string,
-        }),
+        services.async_get_station_modes,
+        schema=_SCHEMA_STATION_ID,
         supports_response="optional",
     )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_STATION_MODE,
-        async_set_station_mode,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("station_id"): cv.string,
-            vol.Required("mode_id"): vol.Coerce(int),
-        }),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_TOGGLE_PLAYBACK,
-        async_toggle_playback,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-        }),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESET_VOLUME,
-        async_reset_volume,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-        }),
-    )
-
     hass.services.async_register(
         DOMAIN,
         SERVICE_SEARCH,
-        async_search,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("query"): cv.string,
-        }),
+        services.async_search,
+        schema=_SCHEMA_SEARCH,
         supports_response="optional",
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_GENRES,
-        async_get_genres,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-        }),
+        services.async_get_genres,
+        schema=_SCHEMA_EMPTY,
         supports_response="optional",
     )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CREATE_STATION_FROM_MUSIC_ID,
-        async_create_station_from_music_id,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("music_id"): cv.string,
-        }),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ADD_SHARED_STATION,
-        async_add_shared_station,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("station_id"): cv.string,
-        }),
-    )
-
     hass.services.async_register(
         DOMAIN,
         SERVICE_SWITCH_ACCOUNT,
-        async_switch_account,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_ids,
-            vol.Required("account_id"): cv.string,
-        }),
+        services.async_switch_account,
+        schema=_SCHEMA_SWITCH_ACCOUNT,
     )
 
     return True
@@ -572,6 +495,32 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry when options change."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply config entry changes (host/port updated via options).
+
+    A host/port change only needs the existing coordinator to reconnect, so
+    entities and platforms are kept; a full reload is the fallback.
+    """
+    coordinator: PianobarCoordinator | None = hass.data.get(DOMAIN, {}).get(
+        entry.entry_id
+    )
+    if coordinator is None:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    host = entry.data[CONF_HOST]
+    port = entry.data[CONF_PORT]
+    if (coordinator.host, coordinator.port) == (host, port):
+        # Title-only update; the connection is unaffected
+        return
+
+    await coordinator.async_disconnect()
+    # The new server's process/stations events repopulate what is dropped here
+    coordinator.reset_server_state()
+    coordinator.host = host
+    coordinator.port = port
+    try:
+        await coordinator.async_connect()
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.warning("Reconnect to %s:%s failed, reloading: %s", host, port, err)
+        await hass.config_entries.async_reload(entry.entry_id)
 
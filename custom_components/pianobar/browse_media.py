@@ -11,10 +11,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import translation
 
 from .const import DOMAIN, MEDIA_TYPE_STATION
-from .coordinator import PianobarCoordinator
+from .coordinator import PianobarCoordinator, get_station_index
 
 _LOGGER = logging.getLogger(__name__)
 
+# media_content_id values that mean "the root station list"
+_ROOT_IDS = frozenset({None, "", "root", "stations"})
+_STATION_TYPES = frozenset({MEDIA_TYPE_STATION, "playlist"})
+
 
 async def async_browse_media_internal(
     hass: HomeAssistant,
@@ -37,12 +41,12 @@ async def async_browse_media_internal(
     unknown_station = _title("browse_media_unknown_station", "Unknown Station")
 
     # Root level - return all stations
-    if media_content_id is None or media_content_id in ("", "root", "stations"):
+    if media_content_id in _ROOT_IDS:
         return _build_stations_browse(coordinator, my_stations)
 
     # Specific station requested - return it with empty children
     # (Pandora stations don't have browsable sub-content)
-    if media_content_type in (MEDIA_TYPE_STATION, "playlist"):
+    if media_content_type in _STATION_TYPES:
         return _build_station_browse(
             coordinator, media_content_id, unknown_station
         )
@@ -54,8 +58,14 @@ async def async_browse_media_internal(
 def _build_stations_browse(
     coordinator: PianobarCoordinator, root_title: str
 ) -> BrowseMedia:
-    """Build stations browse structure - flat list at root level."""
-    stations = coordinator.data.get("stations", [])
+    """Build stations browse structure - flat list at root level.
+
+    The tree is cached on the station index, so it is only rebuilt when the
+    stations list is replaced.
+    """
+    index = get_station_index(coordinator.data)
+    if (root := index.browse_root.get(root_title)) is not None:
+        return root
 
     children = [
         BrowseMedia(
@@ -67,10 +77,10 @@ def _build_stations_browse(
             can_expand=False,
             thumbnail=None,
         )
-        for station in stations
+        for station in index.stations
     ]
 
-    return BrowseMedia(
+    root = index.browse_root[root_title] = BrowseMedia(
         media_class=MediaClass.DIRECTORY,
         media_content_id="stations",
         media_content_type="stations",
@@ -79,27 +89,25 @@ def _build_stations_browse(
         can_expand=True,
         children=children,
     )
+    return root
 
 
 def _build_station_browse(
     coordinator: PianobarCoordinator, station_id: str, unknown_title: str
 ) -> BrowseMedia:
     """Build browse structure for a single station (no children - stations are leaf nodes)."""
-    stations = coordinator.data.get("stations", [])
-
-    # Find station by ID or name
-    for station in stations:
-        if station["id"] == station_id or station["name"] == station_id:
-            return BrowseMedia(
-                media_class=MediaClass.PLAYLIST,
-                media_content_id=station["id"],
-                media_content_type=MEDIA_TYPE_STATION,
-                title=station["name"],
-                can_play=True,
-                can_expand=False,
-                children=[],  # Empty - Pandora stations don't have browsable content
-                thumbnail=None,
-            )
+    station = get_station_index(coordinator.data).find(station_id)
+    if station:
+        return BrowseMedia(
+            media_class=MediaClass.PLAYLIST,
+            media_content_id=station["id"],
+            media_content_type=MEDIA_TYPE_STATION,
+            title=station["name"],
+            can_play=True,
+            can_expand=False,
+            children=[],  # Empty - Pandora stations don't have browsable content
+            thumbnail=None,
+        )
 
     # Station not found - return empty placeholder
     return BrowseMedia(
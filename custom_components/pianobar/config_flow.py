@@ -13,8 +13,15 @@ from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DEFAULT_NAME, DEFAULT_PORT, DOMAIN, WS_CONNECT_TIMEOUT
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DEFAULT_NAME,
+    DEFAULT_PORT,
+    DOMAIN,
+    WS_CONNECT_TIMEOUT,
+    WS_PROTOCOLS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,25 +41,23 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     host = data[CONF_HOST]
     port = data[CONF_PORT]
     
-    # Test the WebSocket connection
-    url = f"ws://{host}:{port}/socket.io"
-    
+    session = async_get_clientsession(hass)
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with asyncio.timeout(WS_CONNECT_TIMEOUT):
-                async with session.ws_connect(
-                    url,
-                    protocols=["socketio"],
-                ) as ws:
-                    # Connection successful, close it
-                    await ws.close()
-                    
-    except asyncio.TimeoutError as err:
+        async with asyncio.timeout(WS_CONNECT_TIMEOUT):
+            # Test the WebSocket connection
+            url = f"ws://{host}:{port}/socket.io"
+            async with session.ws_connect(
+                url,
+                protocols=WS_PROTOCOLS,
+            ) as ws:
+                # Connection successful, close it
+                await ws.close()
+
+    except TimeoutError as err:
         raise CannotConnect("Connection timeout") from err
-    except aiohttp.ClientError as err:
-        raise CannotConnect(f"Connection failed: {err}") from err
-    except Exception as err:
-        raise CannotConnect(f"Unexpected error: {err}") from err
+    except (aiohttp.ClientError, OSError) as err:
+        raise CannotConnect(str(err)) from err
 
     # Return info that you want to store in the config entry.
     return {"title": f"{DEFAULT_NAME} ({host})"}
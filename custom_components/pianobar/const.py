@@ -1,46 +1,51 @@
 """Constants for the Pianobar integration."""
+from typing import Final
 
-DOMAIN = "pianobar"
+DOMAIN: Final = "pianobar"
 
 # Config flow
-CONF_HOST = "host"
-CONF_PORT = "port"
+CONF_HOST: Final = "host"
+CONF_PORT: Final = "port"
 
-DEFAULT_PORT = 8080
-DEFAULT_NAME = "Pianobar"
+DEFAULT_PORT: Final = 8080
+DEFAULT_NAME: Final = "Pianobar"
 
 # WebSocket
-WS_CONNECT_TIMEOUT = 10
-WS_RECONNECT_DELAY = 5
-WS_MAX_RECONNECT_DELAY = 300
+WS_PROTOCOLS: Final = ("socketio",)
+WS_CONNECT_TIMEOUT: Final = 10
+WS_RECONNECT_DELAY: Final = 5
+WS_MAX_RECONNECT_DELAY: Final = 300
 # Wait for first `process` after `query` so coordinator.data is populated before platforms load
-INITIAL_PROCESS_TIMEOUT = 30.0
+INITIAL_PROCESS_TIMEOUT: Final = 30.0
+# Progress ticks within this many seconds of the extrapolated position are not
+# written; HA extrapolates media_position from media_position_updated_at
+POSITION_DRIFT_TOLERANCE: Final = 1.5
 
 # Services
-SERVICE_LOVE_SONG = "love_song"
-SERVICE_BAN_SONG = "ban_song"
-SERVICE_TIRED_OF_SONG = "tired_of_song"
-SERVICE_CREATE_STATION = "create_station"
-SERVICE_RENAME_STATION = "rename_station"
-SERVICE_DELETE_STATION = "delete_station"
-SERVICE_RECONNECT = "reconnect"
-SERVICE_EXPLAIN_SONG = "explain_song"
-SERVICE_GET_UPCOMING = "get_upcoming"
-SERVICE_SET_QUICK_MIX = "set_quick_mix"
-SERVICE_ADD_SEED = "add_seed"
-SERVICE_GET_STATION_INFO = "get_station_info"
-SERVICE_DELETE_SEED = "delete_seed"
-SERVICE_DELETE_FEEDBACK = "delete_feedback"
-SERVICE_GET_STATION_MODES = "get_station_modes"
-SERVICE_SET_STATION_MODE = "set_station_mode"
-SERVICE_TOGGLE_PLAYBACK = "toggle_playback"
-SERVICE_RESET_VOLUME = "reset_volume"
-SERVICE_SEARCH = "search"
-SERVICE_GET_GENRES = "get_genres"
-SERVICE_CREATE_STATION_FROM_MUSIC_ID = "create_station_from_music_id"
-SERVICE_ADD_SHARED_STATION = "add_shared_station"
-SERVICE_SWITCH_ACCOUNT = "switch_account"
+SERVICE_LOVE_SONG: Final = "love_song"
+SERVICE_BAN_SONG: Final = "ban_song"
+SERVICE_TIRED_OF_SONG: Final = "tired_of_song"
+SERVICE_CREATE_STATION: Final = "create_station"
+SERVICE_RENAME_STATION: Final = "rename_station"
+SERVICE_DELETE_STATION: Final = "delete_station"
+SERVICE_RECONNECT: Final = "reconnect"
+SERVICE_EXPLAIN_SONG: Final = "explain_song"
+SERVICE_GET_UPCOMING: Final = "get_upcoming"
+SERVICE_SET_QUICK_MIX: Final = "set_quick_mix"
+SERVICE_ADD_SEED: Final = "add_seed"
+SERVICE_GET_STATION_INFO: Final = "get_station_info"
+SERVICE_DELETE_SEED: Final = "delete_seed"
+SERVICE_DELETE_FEEDBACK: Final = "delete_feedback"
+SERVICE_GET_STATION_MODES: Final = "get_station_modes"
+SERVICE_SET_STATION_MODE: Final = "set_station_mode"
+SERVICE_TOGGLE_PLAYBACK: Final = "toggle_playback"
+SERVICE_RESET_VOLUME: Final = "reset_volume"
+SERVICE_SEARCH: Final = "search"
+SERVICE_GET_GENRES: Final = "get_genres"
+SERVICE_CREATE_STATION_FROM_MUSIC_ID: Final = "create_station_from_music_id"
+SERVICE_ADD_SHARED_STATION: Final = "add_shared_station"
+SERVICE_SWITCH_ACCOUNT: Final = "switch_account"
 
 # Media browser
-MEDIA_TYPE_STATION = "station"
+MEDIA_TYPE_STATION: Final = "station"
 
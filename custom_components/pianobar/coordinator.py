@@ -2,25 +2,81 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
 import logging
+import random
+import time
 from typing import Any
 
 import aiohttp
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
     INITIAL_PROCESS_TIMEOUT,
+    POSITION_DRIFT_TOLERANCE,
     WS_CONNECT_TIMEOUT,
     WS_MAX_RECONNECT_DELAY,
+    WS_PROTOCOLS,
     WS_RECONNECT_DELAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# coordinator.data key holding the StationIndex for the current stations list
+STATION_INDEX_KEY = "station_index"
+
+
+@dataclass(slots=True)
+class StationIndex:
+    """Lookup tables derived from one stations list."""
+
+    stations: Sequence[dict[str, Any]]
+    names: list[str] = field(default_factory=list)
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    by_name: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Root browse tree built from this list, keyed by its (translated) title
+    browse_root: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, stations: Sequence[dict[str, Any]]) -> StationIndex:
+        """Index a stations list by ID and by name, and list its names."""
+        index = cls(stations)
+        for station in stations:
+            index.names.append(station["name"])
+            # First match wins, as with a linear scan of the list
+            index.by_id.setdefault(station["id"], station)
+            index.by_name.setdefault(station["name"], station)
+        return index
+
+    def find(self, station_id_or_name: str) -> dict[str, Any] | None:
+        """Find a station by ID first, then by name."""
+        return self.by_id.get(station_id_or_name) or self.by_name.get(
+            station_id_or_name
+        )
+
+
+def get_station_index(data: dict[str, Any]) -> StationIndex:
+    """Return the index for data["stations"], rebuilding it if the list was replaced."""
+    stations = data.get("stations") or ()
+    index: StationIndex | None = data.get(STATION_INDEX_KEY)
+    if index is None or index.stations is not stations:
+        index = data[STATION_INDEX_KEY] = StationIndex.build(stations)
+    return index
+
+
+@lru_cache(maxsize=64)
+def _encode_action(action: str) -> str:
+    """Return the Socket.IO frame for a parameterless action (cached)."""
+    return "2" + json_dumps(["action", action])
+
 
 class PianobarCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Pianobar data from WebSocket."""
@@ -35,12 +91,16 @@ class PianobarCoordinator(DataUpdateCoordinator):
         self.host = host
         self.port = port
         self._ws: aiohttp.ClientWebSocketResponse | None = None
-        self._session: aiohttp.ClientSession | None = None
+        # Home Assistant's shared session; it owns the connector and closes it
+        self._session = async_get_clientsession(hass)
         self._reconnect_task: asyncio.Task | None = None
         self._listen_task: asyncio.Task | None = None
         self._reconnect_delay = WS_RECONNECT_DELAY
-        self._is_closing = False
+        # Set while shutting down; stops the listener from scheduling reconnects
+        self._closing = asyncio.Event()
         self._initial_process_event = asyncio.Event()
+        # time.monotonic() at which data["elapsed"] was last anchored
+        self._position_anchored_at = 0.0
 
         # State data
         self.data: dict[str, Any] = {
@@ -50,12 +110,15 @@ class PianobarCoordinator(DataUpdateCoordinator):
             "maxGain": 10,
             "station": "",
             "stationId": "",
-            "stations": [],
+            "stations": (),
             "pandora_connected": True,
         }
+        self._set_stations([])
         
         # Response data storage (for service calls that return data)
         self._response_data: dict[str, Any] = {}
+        # Futures for in-flight expect_response() calls, keyed by response key
+        self._pending: dict[str, asyncio.Future[Any]] = {}
 
     @property
     def is_connected(self) -> bool:
@@ -63,7 +126,7 @@ class PianobarCoordinator(DataUpdateCoordinator):
         return self._ws is not None and not self._ws.closed
 
     async def _async_release_connection(self) -> None:
-        """Cancel listen task and close WebSocket + ClientSession."""
+        """Cancel listen task and close the WebSocket."""
         if self._listen_task:
             self._listen_task.cancel()
             try:
@@ -76,29 +139,22 @@ class PianobarCoordinator(DataUpdateCoordinator):
             await self._ws.close()
         self._ws = None
 
-        if self._session and not self._session.closed:
-            await self._session.close()
-        self._session = None
-
     async def _async_cleanup_failed_connect(self) -> None:
-        """Release resources after a failed connect; avoid leaking aiohttp sessions."""
-        # _listen() finally schedules reconnect only when not _is_closing; set True
+        """Release resources after a failed connect; avoid leaking the WebSocket."""
+        # _listen() finally schedules reconnect only when not closing; set it
         # before cancelling the listen task so teardown does not spawn _reconnect().
-        self._is_closing = True
+        self._closing.set()
         try:
             await self._async_release_connection()
         finally:
-            self._is_closing = False
+            self._closing.clear()
 
     async def async_connect(self) -> None:
         """Connect to the WebSocket."""
         # Allow reuse of this coordinator after partial teardown (e.g. failed setup retry).
-        self._is_closing = False
+        self._closing.clear()
         self._initial_process_event.clear()
 
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
-
         url = f"ws://{self.host}:{self.port}/socket.io"
         
         try:
@@ -106,7 +162,7 @@ class PianobarCoordinator(DataUpdateCoordinator):
             self._ws = await asyncio.wait_for(
                 self._session.ws_connect(
                     url,
-                    protocols=["socketio"],
+                    protocols=WS_PROTOCOLS,
                     heartbeat=30,
                 ),
                 timeout=WS_CONNECT_TIMEOUT,
@@ -145,14 +201,12 @@ class PianobarCoordinator(DataUpdateCoordinator):
 
     async def async_disconnect(self) -> None:
         """Disconnect from the WebSocket."""
-        self._is_closing = True
+        self._closing.set()
 
         if self._reconnect_task:
+            # Cancel too: a reconnect attempt in progress would clear _closing
             self._reconnect_task.cancel()
-            try:
-                await self._reconnect_task
-            except asyncio.CancelledError:
-                pass
+            await asyncio.gather(self._reconnect_task, return_exceptions=True)
             self._reconnect_task = None
 
         await self._async_release_connection()
@@ -176,7 +230,7 @@ class PianobarCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Error in WebSocket listener: %s", err)
         finally:
-            if not self._is_closing:
+            if not self._closing.is_set():
                 _LOGGER.warning("WebSocket connection lost, attempting to reconnect")
                 # Clear playback state on connection loss so player cards reset
                 self._clear_playback_state()
@@ -200,34 +254,48 @@ class PianobarCoordinator(DataUpdateCoordinator):
 
     async def _reconnect(self) -> None:
         """Reconnect to the WebSocket with exponential backoff."""
-        while not self._is_closing:
-            await asyncio.sleep(self._reconnect_delay)
-            
+        delay = self._jittered_reconnect_delay()
+        while not self._closing.is_set():
+            # Back off, but stop as soon as the coordinator starts closing
+            try:
+                async with asyncio.timeout(delay):
+                    await self._closing.wait()
+                return
+            except TimeoutError:
+                pass
+
             try:
                 await self.async_connect()
                 _LOGGER.info("Reconnected to Pianobar")
                 return
             except Exception as err:
-                _LOGGER.warning(
-                    "Reconnect failed, retrying in %s seconds: %s",
-                    self._reconnect_delay,
-                    err,
-                )
                 # Exponential backoff
                 self._reconnect_delay = min(
                     self._reconnect_delay * 2, WS_MAX_RECONNECT_DELAY
                 )
+                delay = self._jittered_reconnect_delay()
+                _LOGGER.warning(
+                    "Reconnect failed, retrying in %.1f seconds: %s", delay, err
+                )
+
+    def _jittered_reconnect_delay(self) -> float:
+        """Return the backoff delay with jitter, capped at WS_MAX_RECONNECT_DELAY."""
+        # Jitter spreads out clients of a restarted backend
+        return min(
+            self._reconnect_delay * (0.5 + random.random()), WS_MAX_RECONNECT_DELAY
+        )
 
     async def _handle_message(self, message: str) -> None:
         """Handle incoming WebSocket message."""
-        # Socket.IO messages start with packet type "2" for EVENT
-        if not message.startswith("2"):
+        # Socket.IO EVENT frames are packet type "2" followed by a JSON array;
+        # anything else (including a bare "2" heartbeat) carries no event
+        if len(message) < 2 or message[0] != "2" or message[1] != "[":
             return
             
         try:
             # Remove packet type prefix and parse JSON
             json_str = message[1:]
-            event_data = json.loads(json_str)
+            event_data = json_loads(json_str)
             
             if not isinstance(event_data, list) or len(event_data) < 2:
                 return
@@ -235,124 +303,151 @@ class PianobarCoordinator(DataUpdateCoordinator):
             event_name = event_data[0]
             event_payload = event_data[1]
             
-            _LOGGER.debug("Received event: %s", event_name)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received event: %s", event_name)
             
-            # Handle different event types
-            if event_name == "process":
-                self._handle_process_event(event_payload)
-            elif event_name == "start":
-                self._handle_start_event(event_payload)
-            elif event_name == "stop":
-                self._handle_stop_event()
-            elif event_name == "progress":
-                self._handle_progress_event(event_payload)
-            elif event_name == "volume":
-                self._handle_volume_event(event_payload)
-            elif event_name == "playState":
-                self._handle_play_state_event(event_payload)
-            elif event_name == "stations":
-                self._handle_stations_event(event_payload)
-            elif event_name == "song.explanation":
-                self._handle_song_explanation_event(event_payload)
-            elif event_name == "query.upcoming.result":
-                self._handle_upcoming_result_event(event_payload)
-            elif event_name == "stationInfo":
-                self._handle_station_info_event(event_payload)
-            elif event_name == "stationModes":
-                self._handle_station_modes_event(event_payload)
-            elif event_name == "searchResults":
-                self._handle_search_results_event(event_payload)
-            elif event_name == "genres":
-                self._handle_genres_event(event_payload)
-            elif event_name == "error":
-                self._handle_error_event(event_payload)
-            elif event_name == "pandora.disconnected":
-                self._handle_pandora_disconnected_event(event_payload)
-                
-            # Notify listeners of state change
-            self.async_set_updated_data(self.data)
+            handler = self._EVENT_HANDLERS.get(event_name)
+            if handler is None:
+                return
+
+            # Notify listeners only when entity-visible state changed
+            if handler(self, event_payload):
+                self.async_set_updated_data(self.data)
             
-        except json.JSONDecodeError as err:
+        except ValueError as err:
             _LOGGER.error("Failed to parse message: %s", err)
         except Exception as err:
             _LOGGER.error("Error handling message: %s", err)
 
-    def _handle_process_event(self, payload: dict[str, Any]) -> None:
+    def _set_value(self, key: str, value: Any) -> bool:
+        """Store a value in data and return True if it differs from the old one."""
+        data = self.data
+        if key in data and data[key] == value:
+            return False
+        data[key] = value
+        return True
+
+    def _handle_process_event(self, payload: dict[str, Any]) -> bool:
         """Handle process event (full state update)."""
+        changed = False
         # Only treat as connected when we have meaningful state (song, playing, or non-empty station)
         if (
             payload.get("song") is not None
             or payload.get("playing") is True
             or (payload.get("station") and str(payload.get("station", "")).strip())
         ):
-            self.data["pandora_connected"] = True
+            changed |= self._set_value("pandora_connected", True)
         # Wire protocol sends volume as 0-100, HA expects 0.0-1.0
         wire_volume = payload.get("volume", 0)
-        self.data.update({
-            "playing": payload.get("playing", False),
-            "paused": payload.get("paused", False),
-            "volume": wire_volume / 100.0,
-            "maxGain": payload.get("maxGain", 10),
-            "station": payload.get("station", ""),
-            "stationId": payload.get("stationId", ""),
-        })
-        
+        changed |= self._set_value("playing", payload.get("playing", False))
+        changed |= self._set_value("paused", payload.get("paused", False))
+        changed |= self._set_value("volume", wire_volume / 100.0)
+        changed |= self._set_value("maxGain", payload.get("maxGain", 10))
+        changed |= self._set_value("station", payload.get("station", ""))
+        changed |= self._set_value("stationId", payload.get("stationId", ""))
+
         if payload.get("playing") and "song" in payload:
-            self.data["song"] = payload["song"]
-            if "elapsed" in payload:
-                self.data["elapsed"] = payload["elapsed"]
-                self.data["position_updated_at"] = dt_util.utcnow()
+            changed |= self._set_value("song", payload["song"])
+            if "elapsed" in payload and self._position_drifted(payload["elapsed"]):
+                self._anchor_position(payload["elapsed"])
+                changed = True
 
         # Multi-account state
         if "accounts" in payload:
-            self.data["accounts"] = payload["accounts"]
+            changed |= self._set_value("accounts", payload["accounts"])
         if "current_account" in payload:
-            self.data["current_account"] = payload["current_account"]
+            changed |= self._set_value("current_account", payload["current_account"])
 
         self._initial_process_event.set()
+        return changed
 
-    def _handle_start_event(self, payload: dict[str, Any]) -> None:
+    def _handle_start_event(self, payload: dict[str, Any]) -> bool:
         """Handle start event (new song started)."""
-        self.data.update({
-            "playing": True,
-            "paused": False,
-            "song": payload,
-            "elapsed": 0,
-            "position_updated_at": dt_util.utcnow(),
-            "station": payload.get("station", ""),
-            "stationId": payload.get("stationId", ""),
-        })
-
-    def _handle_stop_event(self) -> None:
+        data = self.data
+        data["playing"] = True
+        data["paused"] = False
+        data["song"] = payload
+        self._anchor_position(0)
+        data["station"] = payload.get("station", "")
+        data["stationId"] = payload.get("stationId", "")
+        return True
+
+    def _handle_stop_event(self, payload: Any = None) -> bool:
         """Handle stop event (song ended/skipped)."""
         self.data["playing"] = False
         if "song" in self.data:
             del self.data["song"]
         if "elapsed" in self.data:
             del self.data["elapsed"]
+        return True
 
-    def _handle_progress_event(self, payload: dict[str, Any]) -> None:
+    def _handle_progress_event(self, payload: dict[str, Any]) -> bool:
         """Handle progress event (playback position update)."""
-        if self.data.get("playing"):
-            self.data["elapsed"] = payload.get("elapsed", 0)
-            self.data["position_updated_at"] = dt_util.utcnow()
-
-    def _handle_volume_event(self, payload: float) -> None:
+        if not self.data.get("playing"):
+            return False
+        elapsed = payload.get("elapsed", 0)
+        if not self._position_drifted(elapsed):
+            return False
+        self._anchor_position(elapsed)
+        return True
+
+    def _position_drifted(self, elapsed: int) -> bool:
+        """Return True if elapsed is off the position extrapolated from the anchor."""
+        expected = self._extrapolated_position()
+        if expected is None:
+            return True
+        # Within tolerance HA's own extrapolation is still right
+        return abs(elapsed - expected) >= POSITION_DRIFT_TOLERANCE
+
+    def _extrapolated_position(self) -> float | None:
+        """Return the anchored position advanced by the time spent playing since."""
+        anchor = self.data.get("elapsed")
+        if anchor is None or self.data.get("paused"):
+            return anchor
+        return anchor + time.monotonic() - self._position_anchored_at
+
+    def _anchor_position(self, elapsed: int) -> None:
+        """Record the playback position and when it was observed."""
+        self._position_anchored_at = time.monotonic()
+        self.data["elapsed"] = elapsed
+        self.data["position_updated_at"] = dt_util.utcnow()
+
+    def _handle_volume_event(self, payload: float) -> bool:
         """Handle volume event (volume changed)."""
         # Wire protocol sends 0-100, HA expects 0.0-1.0
-        self.data["volume"] = payload / 100.0
+        volume = payload / 100.0
+        if volume == self.data.get("volume"):
+            return False
+        self.data["volume"] = volume
+        return True
 
-    def _handle_play_state_event(self, payload: dict[str, Any]) -> None:
+    def _handle_play_state_event(self, payload: dict[str, Any]) -> bool:
         """Handle playState event (pause/resume)."""
-        self.data["paused"] = payload.get("paused", False)
-
-    def _handle_stations_event(self, payload: list[dict[str, Any]]) -> None:
+        paused = payload.get("paused", False)
+        if paused == self.data.get("paused"):
+            return False
+        # Fold the time played so far into the anchor before the clock stops
+        # or restarts, since in-tolerance progress ticks never re-anchored it
+        position = self._extrapolated_position()
+        self.data["paused"] = paused
+        if position is not None:
+            self._anchor_position(round(position))
+        return True
+
+    def _handle_stations_event(self, payload: list[dict[str, Any]]) -> bool:
         """Handle stations event (station list update)."""
-        self.data["stations"] = payload
+        self._set_stations(payload)
         if payload:
             self.data["pandora_connected"] = True
+        return True
+
+    def _set_stations(self, stations: Iterable[dict[str, Any]]) -> None:
+        """Store the station list as a tuple and rebuild its lookup index."""
+        stations = tuple(stations)
+        self.data["stations"] = stations
+        self.data[STATION_INDEX_KEY] = StationIndex.build(stations)
 
-    def _handle_pandora_disconnected_event(self, payload: dict[str, Any]) -> None:
+    def _handle_pandora_disconnected_event(self, payload: dict[str, Any]) -> bool:
         """Handle pandora.disconnected (Pandora session ended; keep stations)."""
         _LOGGER.debug("Pandora disconnected: %s", payload.get("reason", ""))
         self.data["pandora_connected"] = False
@@ -365,6 +460,7 @@ class PianobarCoordinator(DataUpdateCoordinator):
         })
         for key in ("song", "elapsed", "position_updated_at"):
             self.data.pop(key, None)
+        return True
 
     def _clear_playback_state(self) -> None:
         """Clear playback state (used on disconnect/stopped)."""
@@ -378,40 +474,56 @@ class PianobarCoordinator(DataUpdateCoordinator):
         for key in ("song", "elapsed", "position_updated_at"):
             self.data.pop(key, None)
 
-    def _handle_song_explanation_event(self, payload: dict[str, Any]) -> None:
+    def reset_server_state(self) -> None:
+        """Drop everything learned from the current server before switching to another."""
+        self._clear_playback_state()
+        self._set_stations(())
+        for key in ("accounts", "current_account"):
+            self.data.pop(key, None)
+
+    def _handle_song_explanation_event(self, payload: dict[str, Any]) -> bool:
         """Handle song.explanation event (song recommendation explanation)."""
-        self._response_data["song_explanation"] = payload.get("explanation", "")
+        self._set_response("song_explanation", payload.get("explanation", ""))
+        return False
 
-    def _handle_upcoming_result_event(self, payload: list[dict[str, Any]]) -> None:
+    def _handle_upcoming_result_event(self, payload: list[dict[str, Any]]) -> bool:
         """Handle query.upcoming.result event (upcoming songs)."""
-        self._response_data["upcoming"] = payload
+        self._set_response("upcoming", payload)
+        return False
 
-    def _handle_station_info_event(self, payload: dict[str, Any]) -> None:
+    def _handle_station_info_event(self, payload: dict[str, Any]) -> bool:
         """Handle stationInfo event (station seeds and feedback)."""
-        self._response_data["station_info"] = payload
+        self._set_response("station_info", payload)
+        return False
 
-    def _handle_station_modes_event(self, payload: dict[str, Any]) -> None:
+    def _handle_station_modes_event(self, payload: dict[str, Any]) -> bool:
         """Handle stationModes event (station playback modes)."""
-        self._response_data["station_modes"] = payload.get("modes", [])
+        self._set_response("station_modes", payload.get("modes", []))
+        return False
 
-    def _handle_search_results_event(self, payload: dict[str, Any]) -> None:
+    def _handle_search_results_event(self, payload: dict[str, Any]) -> bool:
         """Handle searchResults event (music search results)."""
-        self._response_data["search_results"] = payload
+        self._set_response("search_results", payload)
+        return False
 
-    def _handle_genres_event(self, payload: dict[str, Any]) -> None:
+    def _handle_genres_event(self, payload: dict[str, Any]) -> bool:
         """Handle genres event (genre categories)."""
-        self._response_data["genres"] = payload
+        self._set_response("genres", payload)
+        return False
 
-    def _handle_error_event(self, payload: dict[str, Any]) -> None:
+    def _handle_error_event(self, payload: dict[str, Any]) -> bool:
         """Handle error event from backend."""
         operation = payload.get("operation", "")
         message = payload.get("message", "Unknown error")
         
+        changed = False
+
         # Play/reconnect failed: revert playing state so UI shows Play again
         if operation in ("playback.play", "app.pandora-reconnect"):
             self.data["playing"] = False
             for key in ("song", "elapsed", "position_updated_at"):
                 self.data.pop(key, None)
+            changed = True
         
         # station.change "Station not found": remove station from list, clear current if needed
         if operation == "station.change" and (
@@ -419,71 +531,117 @@ class PianobarCoordinator(DataUpdateCoordinator):
         ):
             station_id = payload.get("stationId") or self.data.get("stationId")
             if station_id:
-                stations = self.data.get("stations", [])
-                self.data["stations"] = [s for s in stations if s.get("id") != station_id]
+                stations = self.data.get("stations", ())
+                self._set_stations(s for s in stations if s.get("id") != station_id)
                 if self.data.get("stationId") == station_id:
                     self.data["station"] = ""
                     self.data["stationId"] = ""
             _LOGGER.debug("Station not found, updated list: %s", operation)
-            return
+            return True
         # app.pandora-reconnect "Last station was deleted": remove station from list
         if operation == "app.pandora-reconnect" and "last station" in message.lower():
             station_id = payload.get("stationId")
             if station_id:
-                stations = self.data.get("stations", [])
-                self.data["stations"] = [s for s in stations if s.get("id") != station_id]
+                stations = self.data.get("stations", ())
+                self._set_stations(s for s in stations if s.get("id") != station_id)
                 if self.data.get("stationId") == station_id:
                     self.data["station"] = ""
                     self.data["stationId"] = ""
             _LOGGER.debug("Last station deleted after reconnect: %s", operation)
-            return
+            return True
         
         # Map operation to response key and store error message
         if operation == "song.explain":
-            self._response_data["song_explanation"] = ""  # Empty string indicates no explanation
+            self._set_response("song_explanation", "")  # Empty string indicates no explanation
             _LOGGER.debug("Backend error for %s: %s", operation, message)
         elif operation == "query.upcoming":
-            self._response_data["upcoming"] = []  # Empty list indicates no upcoming songs
+            self._set_response("upcoming", [])  # Empty list indicates no upcoming songs
             _LOGGER.debug("Backend error for %s: %s", operation, message)
         # Add other operations as needed
+        return changed
+
+    # Socket.IO event name -> handler; each returns True if data changed
+    _EVENT_HANDLERS: dict[str, Callable[[PianobarCoordinator, Any], bool]] = {
+        "process": _handle_process_event,
+        "start": _handle_start_event,
+        "stop": _handle_stop_event,
+        "progress": _handle_progress_event,
+        "volume": _handle_volume_event,
+        "playState": _handle_play_state_event,
+        "stations": _handle_stations_event,
+        "song.explanation": _handle_song_explanation_event,
+        "query.upcoming.result": _handle_upcoming_result_event,
+        "stationInfo": _handle_station_info_event,
+        "stationModes": _handle_station_modes_event,
+        "searchResults": _handle_search_results_event,
+        "genres": _handle_genres_event,
+        "error": _handle_error_event,
+        "pandora.disconnected": _handle_pandora_disconnected_event,
+    }
+
+    def _set_response(self, key: str, value: Any) -> None:
+        """Deliver response data to its waiter, or store it if nobody is waiting."""
+        future = self._pending.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(value)
+        else:
+            self._response_data[key] = value
 
     def get_response_data(self, key: str) -> Any:
         """Get and clear response data for a given key."""
         return self._response_data.pop(key, None)
 
-    async def wait_for_response(self, key: str, timeout: float = 5.0) -> Any:
-        """Wait for response data with timeout."""
-        import asyncio
+    def expect_response(self, key: str) -> asyncio.Future[Any]:
+        """Return the future that the next response for key will resolve.
+
+        Call this before sending the request, so a fast reply cannot arrive
+        before anything is listening for it.
+        """
         # Clear any stale data for this key before waiting for fresh response
         self._response_data.pop(key, None)
-        start_time = asyncio.get_event_loop().time()
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            if key in self._response_data:
-                return self.get_response_data(key)
-            await asyncio.sleep(0.1)
-        return None
+        # Concurrent callers waiting on the same key share one future
+        future = self._pending.get(key)
+        if future is None or future.done():
+            future = self._pending[key] = self.hass.loop.create_future()
+        return future
+
+    async def async_await_response(
+        self, future: asyncio.Future[Any], timeout: float = 5.0
+    ) -> Any:
+        """Wait for a future from expect_response, returning None on timeout."""
+        try:
+            async with asyncio.timeout(timeout):
+                return await asyncio.shield(future)
+        except TimeoutError:
+            return None
+
+    async def wait_for_response(self, key: str, timeout: float = 5.0) -> Any:
+        """Wait for response data with timeout."""
+        return await self.async_await_response(self.expect_response(key), timeout)
 
     async def send_event(self, event_name: str, payload: Any) -> None:
         """Send an event to the WebSocket."""
+        # Format as Socket.IO EVENT message
+        await self._async_send_frame(event_name, "2" + json_dumps([event_name, payload]))
+
+    async def _async_send_frame(self, event_name: str, message: str) -> None:
+        """Send an already encoded Socket.IO frame."""
         if not self._ws or self._ws.closed:
             _LOGGER.error("WebSocket not connected")
             return
             
         try:
-            # Format as Socket.IO EVENT message
-            message = f'2["{event_name}",{json.dumps(payload)}]'
             await self._ws.send_str(message)
-            _LOGGER.debug("Sent event: %s", event_name)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Sent event: %s", event_name)
         except Exception as err:
             _LOGGER.error("Error sending event %s: %s", event_name, err)
 
     async def send_action(self, action: str) -> None:
         """Send an action command."""
-        await self.send_event("action", action)
+        await self._async_send_frame("action", _encode_action(action))
 
     async def send_action_with_params(self, action: str, params: dict[str, Any]) -> None:
         """Send an action command with parameters."""
-        payload = {"action": action}
-        payload.update(params)
-        await self.send_event("action", payload)
+        await self.send_event("action", {"action": action, **params})
 
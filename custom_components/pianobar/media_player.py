@@ -19,7 +19,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .browse_media import async_browse_media_internal
 from .const import DOMAIN, MEDIA_TYPE_STATION
-from .coordinator import PianobarCoordinator
+from .coordinator import PianobarCoordinator, get_station_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,6 +66,10 @@ class PianobarMediaPlayer(CoordinatorEntity[PianobarCoordinator], MediaPlayerEnt
             "manufacturer": "Pianobar",
             "model": "Remote Pianobar",
         }
+        # Current song, refreshed on each coordinator update
+        self._song: dict[str, Any] = coordinator.data.get("song") or {}
+        # Visible state as of the last write, see _handle_coordinator_update
+        self._last_signature: tuple[Any, ...] | None = None
 
     @property
     def state(self) -> MediaPlayerState:
@@ -93,8 +97,7 @@ class PianobarMediaPlayer(CoordinatorEntity[PianobarCoordinator], MediaPlayerEnt
     @property
     def source_list(self) -> list[str] | None:
         """List of available input sources."""
-        stations = self.coordinator.data.get("stations", [])
-        return [station["name"] for station in stations]
+        return get_station_index(self.coordinator.data).names
 
     @property
     def media_content_id(self) -> str | None:
@@ -104,32 +107,27 @@ class PianobarMediaPlayer(CoordinatorEntity[PianobarCoordinator], MediaPlayerEnt
     @property
     def media_title(self) -> str | None:
         """Title of current playing media."""
-        song = self.coordinator.data.get("song")
-        return song.get("title") if song else None
+        return self._song.get("title")
 
     @property
     def media_artist(self) -> str | None:
         """Artist of current playing media."""
-        song = self.coordinator.data.get("song")
-        return song.get("artist") if song else None
+        return self._song.get("artist")
 
     @property
     def media_album_name(self) -> str | None:
         """Album name of current playing media."""
-        song = self.coordinator.data.get("song")
-        return song.get("album") if song else None
+        return self._song.get("album")
 
     @property
     def media_image_url(self) -> str | None:
         """Image url of current playing media."""
-        song = self.coordinator.data.get("song")
-        return song.get("coverArt") if song else None
+        return self._song.get("coverArt")
 
     @property
     def media_duration(self) -> int | None:
         """Duration of current playing media in seconds."""
-        song = self.coordinator.data.get("song")
-        return song.get("duration") if song else None
+        return self._song.get("duration")
 
     @property
     def media_position(self) -> int | None:
@@ -177,7 +175,7 @@ class PianobarMediaPlayer(CoordinatorEntity[PianobarCoordinator], MediaPlayerEnt
             "current_account": self.coordinator.data.get("current_account"),
         }
         # Add rating and song station name from current song if available
-        song = self.coordinator.data.get("song")
+        song = self._song
         if song:
             attrs["rating"] = song.get("rating", 0)
             attrs["song_station_name"] = song.get("songStationName", "")
@@ -288,18 +286,34 @@ class PianobarMediaPlayer(CoordinatorEntity[PianobarCoordinator], MediaPlayerEnt
 
     def _find_station(self, station_id_or_name: str) -> dict[str, Any] | None:
         """Find a station by ID or name."""
-        stations = self.coordinator.data.get("stations", [])
-        
-        # Try to find by ID first
-        station = next((s for s in stations if s["id"] == station_id_or_name), None)
-        if station:
-            return station
-            
-        # Try to find by name
-        return next((s for s in stations if s["name"] == station_id_or_name), None)
+        return get_station_index(self.coordinator.data).find(station_id_or_name)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._song = self.coordinator.data.get("song") or {}
+        # Skip the write when nothing this entity exposes has changed
+        signature = self._state_signature()
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
         self.async_write_ha_state()
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the coordinator values this entity's state is built from."""
+        data = self.coordinator.data
+        return (
+            self.available,
+            self.state,
+            data.get("volume"),
+            data.get("station"),
+            data.get("stationId"),
+            self._song,
+            data.get("elapsed"),
+            data.get("position_updated_at"),
+            data.get("stations"),
+            data.get("accounts"),
+            data.get("current_account"),
+            data.get("pandora_connected"),
+        )
+
@@ -2,15 +2,16 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import PianobarCoordinator
+from .coordinator import PianobarCoordinator, get_station_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,29 +54,36 @@ class PianobarStationSelect(CoordinatorEntity[PianobarCoordinator], SelectEntity
             "manufacturer": "Pandora",
             "model": "Pianobar",
         }
+        self._last_signature: tuple[Any, ...] | None = None
 
     @property
     def options(self) -> list[str]:
         """Return list of station names."""
-        stations = self.coordinator.data.get("stations", [])
-        return [station["name"] for station in stations]
+        return get_station_index(self.coordinator.data).names
 
     @property
     def current_option(self) -> str | None:
         """Return the currently selected station."""
         station = self.coordinator.data.get("station")
-        if station and station in self.options:
+        if station and station in get_station_index(self.coordinator.data).by_name:
             return station
         return None
 
     async def async_select_option(self, option: str) -> None:
         """Change to the selected station."""
-        stations = self.coordinator.data.get("stations", [])
-        for station in stations:
-            if station["name"] == option:
-                await self.coordinator.send_event("station.change", station["id"])
-                _LOGGER.debug("Changed station to: %s (ID: %s)", option, station["id"])
-                break
+        station = get_station_index(self.coordinator.data).by_name.get(option)
+        if station:
+            await self.coordinator.send_event("station.change", station["id"])
+            _LOGGER.debug("Changed station to: %s (ID: %s)", option, station["id"])
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the selection or its options changed."""
+        signature = (self.available, self.current_option, self.options)
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+        self.async_write_ha_state()
 
 
 class PianobarAccountSelect(CoordinatorEntity[PianobarCoordinator], SelectEntity):
@@ -99,6 +107,7 @@ class PianobarAccountSelect(CoordinatorEntity[PianobarCoordinator], SelectEntity
             "manufacturer": "Pandora",
             "model": "Pianobar",
         }
+        self._last_signature: tuple[Any, ...] | None = None
 
     @property
     def options(self) -> list[str]:
@@ -127,3 +136,11 @@ class PianobarAccountSelect(CoordinatorEntity[PianobarCoordinator], SelectEntity
                 _LOGGER.debug("Switching to account: %s (ID: %s)", option, acct["id"])
                 break
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the selection or its options changed."""
+        signature = (self.available, self.current_option, self.options)
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+        self.async_write_ha_state()
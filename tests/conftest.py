@@ -1,22 +1,19 @@
 """Fixtures for Pianobar tests."""
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.const import CONF_HOST, CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.setup import async_setup_component
-
-from custom_components.pianobar.const import DOMAIN
 
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-@pytest.fixture(autouse=True)
-def auto_enable_custom_integrations(enable_custom_integrations):
-    """Enable custom integrations for all tests."""
-    yield
+from custom_components.pianobar.const import DOMAIN
+from custom_components.pianobar.coordinator import PianobarCoordinator
 
 
 @pytest.fixture
@@ -39,50 +36,117 @@ def mock_websocket():
     return mock_ws
 
 
+@pytest.fixture(scope="session")
+def coordinator_spec() -> list[str]:
+    """Attribute names of PianobarCoordinator, introspected once per session."""
+    return [
+        *dir(PianobarCoordinator),
+        "hass",
+        "data",
+        "host",
+        "port",
+        "last_update_success",
+        "_ws",
+    ]
+
+
 @pytest.fixture
-def mock_coordinator(mock_websocket):
+def mock_coordinator(coordinator_spec, mock_websocket):
     """Mock PianobarCoordinator."""
-    with patch(
-        "custom_components.pianobar.coordinator.PianobarCoordinator"
-    ) as mock_coord:
-        coordinator = mock_coord.return_value
-        coordinator.async_connect = AsyncMock()
-        coordinator.async_disconnect = AsyncMock()
-        coordinator.send_event = AsyncMock()
-        coordinator.send_action = AsyncMock()
-        coordinator.send_action_with_params = AsyncMock()
-        coordinator._ws = mock_websocket
-        coordinator.data = {
-            "playing": False,
-            "paused": False,
-            "volume": 0,
-            "maxGain": 10,
-            "station": "",
-            "stationId": "",
-            "stations": [],
-        }
-        yield coordinator
+    coordinator = MagicMock(spec=coordinator_spec)
+    coordinator.async_connect = AsyncMock()
+    coordinator.async_disconnect = AsyncMock()
+    coordinator.send_event = AsyncMock()
+    coordinator.send_action = AsyncMock()
+    coordinator.send_action_with_params = AsyncMock()
+    coordinator.wait_for_response = AsyncMock()
+    coordinator.async_await_response = AsyncMock()
+    coordinator._ws = mock_websocket
+    coordinator.data = {
+        "playing": False,
+        "paused": False,
+        "volume": 0,
+        "maxGain": 10,
+        "station": "",
+        "stationId": "",
+        "stations": [],
+    }
+    return coordinator
+
+
+@pytest.fixture(scope="session")
+def config_entry_template() -> dict:
+    """Keyword arguments for the test config entry (shared; do not mutate)."""
+    return {
+        "domain": DOMAIN,
+        "title": "Pianobar (127.0.0.1)",
+        "data": {CONF_HOST: "127.0.0.1", CONF_PORT: 3000},
+        "entry_id": "test_entry_id",
+        "unique_id": "127.0.0.1:3000",
+    }
 
 
 @pytest.fixture
-def mock_config_entry(hass: HomeAssistant):
+def mock_config_entry(config_entry_template) -> MockConfigEntry:
     """Mock ConfigEntry."""
-    from pytest_homeassistant_custom_component.common import MockConfigEntry
-    
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        title="Pianobar (127.0.0.1)",
-        data={CONF_HOST: "127.0.0.1", CONF_PORT: 3000},
-        entry_id="test_entry_id",
-        unique_id="127.0.0.1:3000",
-    )
-    return entry
+    return MockConfigEntry(**config_entry_template)
+
+
+@pytest.fixture
+def platforms() -> tuple[Platform, ...]:
+    """Platforms setup_integration forwards to (none unless a test asks)."""
+    return ()
+
+
+@pytest.fixture
+async def setup_integration(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+    mock_coordinator,
+    platforms: tuple[Platform, ...],
+) -> AsyncGenerator[MagicMock, None]:
+    """Set up the integration with mock_coordinator as its coordinator."""
+    mock_config_entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.pianobar.PianobarCoordinator",
+        new=MagicMock(spec=PianobarCoordinator, return_value=mock_coordinator),
+    ), patch("custom_components.pianobar.PLATFORMS", platforms):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        yield mock_coordinator
 
 
 @pytest.fixture
+async def setup_integration_ws(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    mock_config_entry: MockConfigEntry,
+    mock_websocket,
+    platforms: tuple[Platform, ...],
+) -> AsyncGenerator[PianobarCoordinator, None]:
+    """Set up the integration with a real coordinator on mock_websocket.
+
+    Only the socket connect is replaced, so frames sent by service calls go
+    through the coordinator's own encoding and land on mock_websocket.send_str.
+    """
+
+    async def _connect(coordinator: PianobarCoordinator) -> None:
+        coordinator._ws = mock_websocket
+
+    mock_config_entry.add_to_hass(hass)
+
+    with patch.object(
+        PianobarCoordinator, "async_connect", autospec=True, side_effect=_connect
+    ), patch("custom_components.pianobar.PLATFORMS", platforms):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        yield hass.data[DOMAIN][mock_config_entry.entry_id]
+
+
+@pytest.fixture(scope="session")
 def mock_station_data():
-    """Mock station data."""
-    return [
+    """Mock station data (shared across tests; read-only)."""
+    stations = [
         {
             "id": "123456789",
             "name": "Test Station 1",
@@ -102,34 +166,39 @@ def mock_station_data():
             "isQuickMixed": False,
         },
     ]
+    return tuple(MappingProxyType(station) for station in stations)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_song_data():
-    """Mock song data."""
-    return {
-        "title": "Test Song",
-        "artist": "Test Artist",
-        "album": "Test Album",
-        "coverArt": "https://example.com/art.jpg",
-        "rating": 1,
-        "duration": 240,
-        "trackToken": "test_track_token",
-        "songStationName": "Test Station",
-    }
+    """Mock song data (shared across tests; read-only)."""
+    return MappingProxyType(
+        {
+            "title": "Test Song",
+            "artist": "Test Artist",
+            "album": "Test Album",
+            "coverArt": "https://example.com/art.jpg",
+            "rating": 1,
+            "duration": 240,
+            "trackToken": "test_track_token",
+            "songStationName": "Test Station",
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_process_event(mock_song_data):
-    """Mock process event payload."""
-    return {
-        "playing": True,
-        "paused": False,
-        "volume": -5,
-        "maxGain": 10,
-        "station": "Test Station 1",
-        "stationId": "123456789",
-        "elapsed": 45,
-        "song": mock_song_data,
-    }
+    """Mock process event payload (shared across tests; read-only)."""
+    return MappingProxyType(
+        {
+            "playing": True,
+            "paused": False,
+            "volume": -5,
+            "maxGain": 10,
+            "station": "Test Station 1",
+            "stationId": "123456789",
+            "elapsed": 45,
+            "song": mock_song_data,
+        }
+    )
 
@@ -1,16 +1,18 @@
 """Test the Pianobar browse media."""
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from homeassistant.components.media_player import MediaClass
+from homeassistant.components.media_player import BrowseMedia, MediaClass
 from homeassistant.core import HomeAssistant
 
 from custom_components.pianobar.browse_media import async_browse_media_internal
 from custom_components.pianobar.const import DOMAIN, MEDIA_TYPE_STATION
 
+pytestmark = pytest.mark.unit
+
 
 def _browse_translation_patch():
     prefix = f"component.{DOMAIN}.common."
@@ -20,33 +22,86 @@ def _browse_translation_patch():
     }
 
 
-async def test_browse_media_root(hass: HomeAssistant, mock_coordinator) -> None:
-    """Test browsing root level - shows stations directly."""
-    with patch(
-        "custom_components.pianobar.browse_media.translation.async_get_translations",
-        new_callable=AsyncMock,
-        return_value=_browse_translation_patch(),
-    ):
-        result = await async_browse_media_internal(
-            hass,
-            mock_coordinator,
-            None,
-            None,
-        )
-    
-    assert result.title == "My Stations"
-    assert result.media_class == MediaClass.DIRECTORY
-    assert result.can_play is False
-    assert result.can_expand is True
-
-
-async def test_browse_media_stations(
+def _assert_browse(
+    result: BrowseMedia,
+    title: str,
+    media_class: MediaClass,
+    content_id: str,
+    can_play: bool,
+) -> None:
+    """Assert the fields every browse node is checked on.
+
+    Directories expand and stations are leaves.
+    """
+    assert result.title == title
+    assert result.media_class == media_class
+    assert result.media_content_id == content_id
+    assert result.can_play is can_play
+    assert result.can_expand is (media_class == MediaClass.DIRECTORY)
+
+
+# (with_stations, media type, media id, title, media class, content id,
+#  can_play, number of children)
+BROWSE_CASES = [
+    pytest.param(
+        False, None, None, "My Stations", MediaClass.DIRECTORY, "stations", False, 0,
+        id="root",
+    ),
+    pytest.param(
+        True, None, None, "My Stations", MediaClass.DIRECTORY, "stations", False, 3,
+        id="stations",
+    ),
+    pytest.param(
+        True, MEDIA_TYPE_STATION, "123456789", "Test Station 1",
+        MediaClass.PLAYLIST, "123456789", True, 0,
+        id="specific_station",
+    ),
+    pytest.param(
+        True, MEDIA_TYPE_STATION, "QuickMix", "QuickMix",
+        MediaClass.PLAYLIST, "555555555", True, 0,
+        id="specific_station_by_name",
+    ),
+    pytest.param(
+        True, MEDIA_TYPE_STATION, "000000000", "Unknown Station",
+        MediaClass.PLAYLIST, "000000000", False, 0,
+        id="unknown_station",
+    ),
+    pytest.param(
+        False, "invalid_type", "invalid_id", "My Stations",
+        MediaClass.DIRECTORY, "stations", False, 0,
+        id="invalid_type",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    (
+        "with_stations",
+        "media_type",
+        "media_id",
+        "exp_title",
+        "exp_class",
+        "exp_content_id",
+        "exp_can_play",
+        "exp_children",
+    ),
+    BROWSE_CASES,
+)
+async def test_browse_media(
     hass: HomeAssistant,
     mock_coordinator,
     mock_station_data,
+    with_stations: bool,
+    media_type: str | None,
+    media_id: str | None,
+    exp_title: str,
+    exp_class: MediaClass,
+    exp_content_id: str,
+    exp_can_play: bool,
+    exp_children: int,
 ) -> None:
-    """Test browsing stations at root level."""
-    mock_coordinator.data = {"stations": mock_station_data}
+    """Test browsing the root, single stations and fallbacks."""
+    mock_coordinator.data = {"stations": mock_station_data if with_stations else []}
 
     with patch(
         "custom_components.pianobar.browse_media.translation.async_get_translations",
@@ -56,31 +111,21 @@ async def test_browse_media_stations(
         result = await async_browse_media_internal(
             hass,
             mock_coordinator,
-            None,
-            None,
+            media_type,
+            media_id,
         )
 
-    assert result.title == "My Stations"
-    assert result.media_class == MediaClass.DIRECTORY
-    assert result.can_play is False
-    assert result.can_expand is True
-    assert len(result.children) == 3
-    
-    # Check first station
-    assert result.children[0].title == "Test Station 1"
-    assert result.children[0].media_content_id == "123456789"
-    assert result.children[0].media_content_type == MEDIA_TYPE_STATION
-    assert result.children[0].media_class == MediaClass.PLAYLIST
-    assert result.children[0].can_play is True
-    assert result.children[0].can_expand is False
-
-
-async def test_browse_media_empty_stations(
+    _assert_browse(result, exp_title, exp_class, exp_content_id, exp_can_play)
+    assert len(result.children) == exp_children
+
+
+async def test_browse_media_station_children(
     hass: HomeAssistant,
     mock_coordinator,
+    mock_station_data,
 ) -> None:
-    """Test browsing with no stations."""
-    mock_coordinator.data = {"stations": []}
+    """Test the root lists each station as a playable leaf."""
+    mock_coordinator.data = {"stations": mock_station_data}
 
     with patch(
         "custom_components.pianobar.browse_media.translation.async_get_translations",
@@ -94,16 +139,17 @@ async def test_browse_media_empty_stations(
             None,
         )
 
-    assert result.title == "My Stations"
-    assert len(result.children) == 0
+    child = result.children[0]
+    _assert_browse(child, "Test Station 1", MediaClass.PLAYLIST, "123456789", True)
+    assert child.media_content_type == MEDIA_TYPE_STATION
 
 
-async def test_browse_media_specific_station(
+async def test_browse_media_root_cached_until_stations_change(
     hass: HomeAssistant,
     mock_coordinator,
     mock_station_data,
 ) -> None:
-    """Test browsing a specific station returns empty children."""
+    """Test the root tree is reused until the stations list is replaced."""
     mock_coordinator.data = {"stations": mock_station_data}
 
     with patch(
@@ -111,39 +157,13 @@ async def test_browse_media_specific_station(
         new_callable=AsyncMock,
         return_value=_browse_translation_patch(),
     ):
-        result = await async_browse_media_internal(
-            hass,
-            mock_coordinator,
-            MEDIA_TYPE_STATION,
-            "123456789",
-        )
-    
-    # Station should be returned with empty children (no sub-content)
-    assert result.title == "Test Station 1"
-    assert result.media_class == MediaClass.PLAYLIST
-    assert result.can_play is True
-    assert result.can_expand is False
-    assert result.children == []
-
-
-async def test_browse_media_invalid_type(
-    hass: HomeAssistant,
-    mock_coordinator,
-) -> None:
-    """Test browsing with invalid media type falls back to root."""
-    with patch(
-        "custom_components.pianobar.browse_media.translation.async_get_translations",
-        new_callable=AsyncMock,
-        return_value=_browse_translation_patch(),
-    ):
-        result = await async_browse_media_internal(
-            hass,
-            mock_coordinator,
-            "invalid_type",
-            "invalid_id",
+        first = await async_browse_media_internal(hass, mock_coordinator, None, None)
+        second = await async_browse_media_internal(
+            hass, mock_coordinator, None, "root"
         )
-    
-    # Should fall back to root (stations list)
-    assert result.title == "My Stations"
-    assert result.media_class == MediaClass.DIRECTORY
+        mock_coordinator.data["stations"] = mock_station_data[:1]
+        third = await async_browse_media_internal(hass, mock_coordinator, None, None)
 
+    assert second is first
+    assert third is not first
+    assert len(third.children) == 1
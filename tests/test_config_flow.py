@@ -1,6 +1,8 @@
 """Test the Pianobar config flow."""
 from __future__ import annotations
 
+import asyncio
+import socket
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -12,10 +14,36 @@ from homeassistant.data_entry_flow import FlowResultType
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.pianobar.const import DEFAULT_PORT, DOMAIN
+from custom_components.pianobar.config_flow import CannotConnect, validate_input
+from custom_components.pianobar.const import DOMAIN
 
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.usefixtures("enable_custom_integrations"),
+]
 
-async def test_form(hass: HomeAssistant) -> None:
+
+@pytest.fixture
+def mock_session(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Mock the shared Home Assistant session validate_input connects with."""
+    mock_ws = MagicMock()
+    mock_ws.close = AsyncMock()
+
+    # ws_connect returns an async context manager
+    mock_ws_cm = MagicMock()
+    mock_ws_cm.__aenter__ = AsyncMock(return_value=mock_ws)
+    mock_ws_cm.__aexit__ = AsyncMock(return_value=None)
+
+    session = MagicMock()
+    session.ws_connect = MagicMock(return_value=mock_ws_cm)
+    monkeypatch.setattr(
+        "custom_components.pianobar.config_flow.async_get_clientsession",
+        lambda hass: session,
+    )
+    return session
+
+
+async def test_form(hass: HomeAssistant, mock_setup_entry: AsyncMock) -> None:
     """Test we get the form."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -26,10 +54,7 @@ async def test_form(hass: HomeAssistant) -> None:
     with patch(
         "custom_components.pianobar.config_flow.validate_input",
         return_value={"title": "Pianobar (127.0.0.1)"},
-    ), patch(
-        "custom_components.pianobar.async_setup_entry",
-        return_value=True,
-    ) as mock_setup_entry:
+    ):
         result2 = await hass.config_entries.flow.async_configure(
             result["flow_id"],
             {
@@ -70,15 +95,11 @@ async def test_form_cannot_connect(hass: HomeAssistant) -> None:
     assert result2["errors"] == {"base": "unknown"}
 
 
-async def test_form_already_configured(hass: HomeAssistant) -> None:
+async def test_form_already_configured(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
     """Test we handle already configured."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        title="Pianobar (127.0.0.1)",
-        data={CONF_HOST: "127.0.0.1", CONF_PORT: 3000},
-        unique_id="127.0.0.1:3000",
-    )
-    entry.add_to_hass(hass)
+    mock_config_entry.add_to_hass(hass)
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -100,54 +121,68 @@ async def test_form_already_configured(hass: HomeAssistant) -> None:
     assert result2["reason"] == "already_configured"
 
 
-async def test_validate_input_success(hass: HomeAssistant) -> None:
+async def test_validate_input_success(hass: HomeAssistant, mock_session) -> None:
     """Test input validation with successful connection."""
-    from custom_components.pianobar.config_flow import validate_input
+    result = await validate_input(
+        hass,
+        {CONF_HOST: "127.0.0.1", CONF_PORT: 3000},
+    )
 
-    # Create a proper async context manager mock for ws_connect
-    mock_ws = MagicMock()
-    mock_ws.close = AsyncMock()
-    
-    # ws_connect returns an async context manager
-    mock_ws_cm = MagicMock()
-    mock_ws_cm.__aenter__ = AsyncMock(return_value=mock_ws)
-    mock_ws_cm.__aexit__ = AsyncMock(return_value=None)
-    
-    # session is an async context manager
-    mock_session = MagicMock()
-    mock_session.ws_connect = MagicMock(return_value=mock_ws_cm)
-    
-    mock_session_cm = MagicMock()
-    mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-    
-    with patch("custom_components.pianobar.config_flow.aiohttp.ClientSession", return_value=mock_session_cm):
-        result = await validate_input(
+    assert result == {"title": "Pianobar (127.0.0.1)"}
+
+
+async def test_validate_input_timeout(hass: HomeAssistant, mock_session) -> None:
+    """Test input validation with timeout."""
+    mock_session.ws_connect.side_effect = asyncio.TimeoutError()
+
+    with pytest.raises(CannotConnect):
+        await validate_input(
             hass,
             {CONF_HOST: "127.0.0.1", CONF_PORT: 3000},
         )
 
-    assert result == {"title": "Pianobar (127.0.0.1)"}
 
+async def test_validate_input_connects_to_host(
+    hass: HomeAssistant, mock_session
+) -> None:
+    """Test the WebSocket targets the configured host."""
+    await validate_input(hass, {CONF_HOST: "pianobar.local", CONF_PORT: 3000})
 
-async def test_validate_input_timeout(hass: HomeAssistant) -> None:
-    """Test input validation with timeout."""
-    from custom_components.pianobar.config_flow import CannotConnect, validate_input
-    
-    import asyncio
-    
-    # session is an async context manager
-    mock_session = MagicMock()
-    mock_session.ws_connect = MagicMock(side_effect=asyncio.TimeoutError())
-    
-    mock_session_cm = MagicMock()
-    mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-    
-    with patch("custom_components.pianobar.config_flow.aiohttp.ClientSession", return_value=mock_session_cm):
-        with pytest.raises(CannotConnect):
-            await validate_input(
-                hass,
-                {CONF_HOST: "127.0.0.1", CONF_PORT: 3000},
-            )
+    assert mock_session.ws_connect.call_args[0][0] == (
+        "ws://pianobar.local:3000/socket.io"
+    )
+
+
+async def test_validate_input_unresolvable_host(
+    hass: HomeAssistant, mock_session
+) -> None:
+    """Test a host that does not resolve raises CannotConnect."""
+    mock_session.ws_connect.side_effect = socket.gaierror("Name or service not known")
+
+    with pytest.raises(CannotConnect):
+        await validate_input(
+            hass,
+            {CONF_HOST: "no-such-host.invalid", CONF_PORT: 3000},
+        )
 
+
+async def test_validate_input_port_closed(hass: HomeAssistant, mock_session) -> None:
+    """Test a refused connection raises CannotConnect."""
+    mock_session.ws_connect.side_effect = ConnectionRefusedError()
+
+    with pytest.raises(CannotConnect):
+        await validate_input(
+            hass,
+            {CONF_HOST: "127.0.0.1", CONF_PORT: 3000},
+        )
+
+
+async def test_validate_input_cancelled(hass: HomeAssistant, mock_session) -> None:
+    """Test cancellation propagates instead of becoming CannotConnect."""
+    mock_session.ws_connect.side_effect = asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        await validate_input(
+            hass,
+            {CONF_HOST: "127.0.0.1", CONF_PORT: 3000},
+        )
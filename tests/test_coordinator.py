@@ -6,23 +6,61 @@ import json
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import aiohttp
 import pytest
 
 from homeassistant.core import HomeAssistant
 
-from custom_components.pianobar.coordinator import PianobarCoordinator
+from custom_components.pianobar.const import WS_MAX_RECONNECT_DELAY
+from custom_components.pianobar.coordinator import (
+    STATION_INDEX_KEY,
+    PianobarCoordinator,
+    get_station_index,
+)
 
+pytestmark = pytest.mark.unit
+
+
+def _parse_sio(message: str) -> list:
+    """Decode a Socket.IO event frame sent by the coordinator."""
+    assert message.startswith("2")
+    return json.loads(message[1:])
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant) -> PianobarCoordinator:
+    """Return a coordinator for the test backend."""
+    return PianobarCoordinator(hass, "127.0.0.1", 3000)
 
-async def test_coordinator_connect_success(hass: HomeAssistant) -> None:
-    """Test successful WebSocket connection."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
 
-    mock_ws = AsyncMock()
-    mock_ws.closed = False
-    mock_ws.send_str = AsyncMock()
-    mock_ws.close = AsyncMock()
-    mock_ws.__aiter__ = MagicMock(return_value=AsyncIteratorMock())
+@pytest.fixture
+def plain_coordinator(monkeypatch: pytest.MonkeyPatch) -> PianobarCoordinator:
+    """Return a coordinator for handler tests, built without Home Assistant."""
+    monkeypatch.setattr(
+        "custom_components.pianobar.coordinator.async_get_clientsession", MagicMock()
+    )
+    return PianobarCoordinator(MagicMock(), "127.0.0.1", 3000)
+
+
+@pytest.fixture
+def patched_session(
+    coordinator: PianobarCoordinator, monkeypatch: pytest.MonkeyPatch
+) -> MagicMock:
+    """Replace the coordinator's shared session with a mock."""
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.close = AsyncMock()
+    mock_session.ws_connect = AsyncMock()
+    monkeypatch.setattr(coordinator, "_session", mock_session)
+    return mock_session
+
+
+async def test_coordinator_connect_success(
+    coordinator: PianobarCoordinator,
+    patched_session: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_websocket: MagicMock,
+) -> None:
+    """Test successful WebSocket connection."""
 
     process_json = (
         '2["process",'
@@ -34,55 +72,33 @@ async def test_coordinator_connect_success(hass: HomeAssistant) -> None:
         await coordinator._handle_message(process_json)
         await asyncio.sleep(100)
 
-    mock_session = AsyncMock()
-    mock_session.ws_connect = AsyncMock(return_value=mock_ws)
-    mock_session.closed = False
-    mock_session.close = AsyncMock()
-
-    with patch("aiohttp.ClientSession", return_value=mock_session):
-        with patch.object(coordinator, "_listen", new=fake_listen):
-            await coordinator.async_connect()
-
-        assert coordinator._ws == mock_ws
-        mock_ws.send_str.assert_called_once()
-        assert coordinator._initial_process_event.is_set()
+    patched_session.ws_connect.return_value = mock_websocket
+    monkeypatch.setattr(coordinator, "_listen", fake_listen)
 
-        await coordinator.async_disconnect()
+    await coordinator.async_connect()
 
+    assert coordinator._ws == mock_websocket
+    mock_websocket.send_str.assert_called_once()
+    assert coordinator._initial_process_event.is_set()
 
-class AsyncIteratorMock:
-    """Mock async iterator that blocks until cancelled."""
-    
-    async def __anext__(self):
-        # Block forever (will be cancelled on disconnect)
-        try:
-            await asyncio.sleep(100)
-        except asyncio.CancelledError:
-            raise StopAsyncIteration
-        raise StopAsyncIteration
+    await coordinator.async_disconnect()
 
 
-async def test_coordinator_connect_timeout(hass: HomeAssistant) -> None:
+async def test_coordinator_connect_timeout(
+    coordinator: PianobarCoordinator, patched_session: MagicMock
+) -> None:
     """Test WebSocket connection timeout."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    with patch("aiohttp.ClientSession") as mock_session:
-        mock_session.return_value.ws_connect = AsyncMock(
-            side_effect=asyncio.TimeoutError()
-        )
-        
-        with pytest.raises(ConnectionError):
-            await coordinator.async_connect()
+    patched_session.ws_connect.side_effect = asyncio.TimeoutError()
 
+    with pytest.raises(ConnectionError):
+        await coordinator.async_connect()
 
-async def test_coordinator_disconnect(hass: HomeAssistant) -> None:
+
+async def test_coordinator_disconnect(
+    coordinator: PianobarCoordinator, mock_websocket: MagicMock
+) -> None:
     """Test WebSocket disconnection."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    mock_ws = AsyncMock()
-    mock_ws.closed = False
-    mock_ws.close = AsyncMock()
-    coordinator._ws = mock_ws
+    coordinator._ws = mock_websocket
     
     mock_session = AsyncMock()
     mock_session.closed = False
@@ -91,32 +107,112 @@ async def test_coordinator_disconnect(hass: HomeAssistant) -> None:
     
     await coordinator.async_disconnect()
     
-    mock_ws.close.assert_called_once()
-    mock_session.close.assert_called_once()
+    mock_websocket.close.assert_called_once()
+    # The shared Home Assistant session is not ours to close
+    mock_session.close.assert_not_called()
 
 
-async def test_handle_process_event(
-    hass: HomeAssistant,
-    mock_process_event,
-    mock_song_data,
+MISSING = object()
+
+_SONG = {"title": "Test Song", "artist": "Test Artist", "duration": 240}
+_STATIONS = [
+    {"id": "123456789", "name": "Test Station 1"},
+    {"id": "987654321", "name": "Test Station 2"},
+]
+
+# (handler, initial data, payload, expected data; MISSING means the key is gone)
+HANDLER_CASES = [
+    pytest.param(
+        "_handle_process_event",
+        {},
+        {
+            "playing": True,
+            "paused": False,
+            "volume": -5,
+            "station": "Test Station 1",
+            "stationId": "123456789",
+            "song": _SONG,
+        },
+        # Wire protocol sends -5, converted to -5/100
+        {
+            "playing": True,
+            "paused": False,
+            "volume": -0.05,
+            "station": "Test Station 1",
+            "song": _SONG,
+        },
+        id="process",
+    ),
+    pytest.param(
+        "_handle_start_event",
+        {},
+        {**_SONG, "station": "Test Station 1", "stationId": "123456789"},
+        {"playing": True, "paused": False, "elapsed": 0, "stationId": "123456789"},
+        id="start",
+    ),
+    pytest.param(
+        "_handle_stop_event",
+        {"playing": True, "song": {"title": "Test"}, "elapsed": 30},
+        None,
+        {"playing": False, "song": MISSING, "elapsed": MISSING},
+        id="stop",
+    ),
+    pytest.param(
+        "_handle_progress_event",
+        {"playing": True},
+        {"elapsed": 67, "duration": 240},
+        {"elapsed": 67},
+        id="progress",
+    ),
+    pytest.param(
+        "_handle_volume_event",
+        {},
+        -10,
+        # Wire protocol sends -10, converted to -10/100
+        {"volume": -0.1},
+        id="volume",
+    ),
+    pytest.param(
+        "_handle_play_state_event",
+        {},
+        {"paused": True},
+        {"paused": True},
+        id="play_state",
+    ),
+    pytest.param(
+        "_handle_stations_event",
+        {},
+        _STATIONS,
+        {"stations": tuple(_STATIONS)},
+        id="stations",
+    ),
+]
+
+
+@pytest.mark.parametrize(("handler", "initial", "payload", "expected"), HANDLER_CASES)
+def test_handle_event(
+    plain_coordinator: PianobarCoordinator,
+    handler: str,
+    initial: dict,
+    payload,
+    expected: dict,
 ) -> None:
-    """Test handling process event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    coordinator._handle_process_event(mock_process_event)
-    
-    assert coordinator.data["playing"] is True
-    assert coordinator.data["paused"] is False
-    assert coordinator.data["volume"] == -0.05  # Wire protocol sends -5, converted to -5/100
-    assert coordinator.data["station"] == "Test Station 1"
-    assert coordinator.data["song"] == mock_song_data
+    """Test each event handler applies its payload to plain_coordinator.data."""
+    plain_coordinator.data.update(initial)
+
+    assert getattr(plain_coordinator, handler)(payload) is True
 
+    for key, value in expected.items():
+        if value is MISSING:
+            assert key not in plain_coordinator.data
+        else:
+            assert plain_coordinator.data[key] == value
 
-async def test_handle_process_event_accounts_and_current_account(
-    hass: HomeAssistant,
+
+def test_handle_process_event_accounts_and_current_account(
+    plain_coordinator: PianobarCoordinator,
 ) -> None:
     """Process payload includes multi-account fields."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
     payload = {
         "playing": False,
         "paused": False,
@@ -126,21 +222,20 @@ async def test_handle_process_event_accounts_and_current_account(
         "accounts": [{"id": "a", "label": "A"}, {"id": "b", "label": "B"}],
         "current_account": {"id": "b", "label": "B"},
     }
-    coordinator._initial_process_event.clear()
-    coordinator._handle_process_event(payload)
-    assert len(coordinator.data["accounts"]) == 2
-    assert coordinator.data["current_account"]["id"] == "b"
-    assert coordinator._initial_process_event.is_set()
+    plain_coordinator._initial_process_event.clear()
+    plain_coordinator._handle_process_event(payload)
+    assert len(plain_coordinator.data["accounts"]) == 2
+    assert plain_coordinator.data["current_account"]["id"] == "b"
+    assert plain_coordinator._initial_process_event.is_set()
 
 
-async def test_handle_process_event_song_rating_preserves_elapsed(
-    hass: HomeAssistant,
+def test_handle_process_event_song_rating_preserves_elapsed(
+    plain_coordinator: PianobarCoordinator,
 ) -> None:
     """Process with updated song.rating sets data['song']['rating'] and keeps elapsed (not zeroed).
     In-place rating sync uses `process` on the server; `start` would reset elapsed to 0.
     """
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    coordinator.data["elapsed"] = 99
+    plain_coordinator.data["elapsed"] = 99
 
     song = {
         "title": "Test Song",
@@ -162,25 +257,40 @@ async def test_handle_process_event_song_rating_preserves_elapsed(
         "elapsed": 99,
         "song": song,
     }
-    coordinator._handle_process_event(payload)
+    plain_coordinator._handle_process_event(payload)
 
-    assert coordinator.data["song"]["rating"] == 1
-    assert coordinator.data["elapsed"] == 99
+    assert plain_coordinator.data["song"]["rating"] == 1
+    assert plain_coordinator.data["elapsed"] == 99
 
 
-async def test_handle_error_event_reconnect_last_station_deleted(
-    hass: HomeAssistant,
+def test_handle_process_event_reanchors_repeated_elapsed(
+    plain_coordinator: PianobarCoordinator,
+    mock_song_data,
+) -> None:
+    """A process event repeating a stale elapsed value still moves the anchor."""
+    payload = {"playing": True, "song": mock_song_data, "elapsed": 30}
+    plain_coordinator._handle_process_event(payload)
+    updated_at = plain_coordinator.data["position_updated_at"]
+
+    # A minute later (e.g. after a pause and resume) the backend is still at 30
+    plain_coordinator._position_anchored_at -= 60
+    assert plain_coordinator._handle_process_event(payload) is True
+    assert plain_coordinator.data["elapsed"] == 30
+    assert plain_coordinator.data["position_updated_at"] is not updated_at
+
+
+def test_handle_error_event_reconnect_last_station_deleted(
+    plain_coordinator: PianobarCoordinator,
 ) -> None:
     """Reconnect error with last station removed updates list and current station."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    coordinator.data["stations"] = [
+    plain_coordinator.data["stations"] = [
         {"id": "gone", "name": "Gone"},
         {"id": "keep", "name": "Keep"},
     ]
-    coordinator.data["stationId"] = "gone"
-    coordinator.data["station"] = "Gone"
+    plain_coordinator.data["stationId"] = "gone"
+    plain_coordinator.data["station"] = "Gone"
 
-    coordinator._handle_error_event(
+    plain_coordinator._handle_error_event(
         {
             "operation": "app.pandora-reconnect",
             "message": "Last station was deleted",
@@ -188,123 +298,132 @@ async def test_handle_error_event_reconnect_last_station_deleted(
         }
     )
 
-    assert len(coordinator.data["stations"]) == 1
-    assert coordinator.data["stations"][0]["id"] == "keep"
-    assert coordinator.data["stationId"] == ""
-    assert coordinator.data["station"] == ""
+    assert len(plain_coordinator.data["stations"]) == 1
+    assert plain_coordinator.data["stations"][0]["id"] == "keep"
+    assert plain_coordinator.data["stationId"] == ""
+    assert plain_coordinator.data["station"] == ""
 
 
-async def test_handle_start_event(hass: HomeAssistant, mock_song_data) -> None:
-    """Test handling start event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    payload = {
-        **mock_song_data,
-        "station": "Test Station 1",
-        "stationId": "123456789",
-    }
-    
-    coordinator._handle_start_event(payload)
-    
-    assert coordinator.data["playing"] is True
-    assert coordinator.data["paused"] is False
-    assert coordinator.data["elapsed"] == 0
-    assert coordinator.data["song"]["title"] == "Test Song"
+def test_handle_progress_event_keeps_anchor_on_track(
+    plain_coordinator: PianobarCoordinator,
+) -> None:
+    """Progress that matches the extrapolated position is not written."""
+    plain_coordinator.data["playing"] = True
 
+    assert plain_coordinator._handle_progress_event({"elapsed": 10}) is True
+    updated_at = plain_coordinator.data["position_updated_at"]
 
-async def test_handle_stop_event(hass: HomeAssistant) -> None:
-    """Test handling stop event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    # Set up initial state
-    coordinator.data["playing"] = True
-    coordinator.data["song"] = {"title": "Test"}
-    coordinator.data["elapsed"] = 30
-    
-    coordinator._handle_stop_event()
-    
-    assert coordinator.data["playing"] is False
-    assert "song" not in coordinator.data
-    assert "elapsed" not in coordinator.data
+    # Within tolerance of where the position would be by now
+    assert plain_coordinator._handle_progress_event({"elapsed": 11}) is False
+    assert plain_coordinator.data["elapsed"] == 10
+    assert plain_coordinator.data["position_updated_at"] is updated_at
 
 
-async def test_handle_progress_event(hass: HomeAssistant) -> None:
-    """Test handling progress event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    coordinator.data["playing"] = True
-    
-    coordinator._handle_progress_event({"elapsed": 67, "duration": 240})
-    
-    assert coordinator.data["elapsed"] == 67
+def test_handle_play_state_event_reanchors_position(
+    plain_coordinator: PianobarCoordinator,
+) -> None:
+    """Pausing and resuming anchor the position played since the last anchor."""
+    plain_coordinator.data["playing"] = True
+    plain_coordinator.data["paused"] = False
+    plain_coordinator._handle_progress_event({"elapsed": 0})
+    started_at = plain_coordinator.data["position_updated_at"]
+
+    # 30 s of in-tolerance ticks leave the anchor at 0
+    plain_coordinator._position_anchored_at -= 30
+    assert plain_coordinator._handle_progress_event({"elapsed": 30}) is False
+    assert plain_coordinator.data["elapsed"] == 0
+
+    assert plain_coordinator._handle_play_state_event({"paused": True}) is True
+    assert plain_coordinator.data["elapsed"] == 30
+    paused_at = plain_coordinator.data["position_updated_at"]
+    assert paused_at is not started_at
+
+    # The time spent paused is not counted when playback resumes
+    plain_coordinator._position_anchored_at -= 120
+    assert plain_coordinator._handle_play_state_event({"paused": False}) is True
+    assert plain_coordinator.data["elapsed"] == 30
+    assert plain_coordinator.data["position_updated_at"] is not paused_at
+
+    # A seek or stall moves the anchor
+    assert plain_coordinator._handle_progress_event({"elapsed": 90}) is True
+    assert plain_coordinator.data["elapsed"] == 90
+
+
+def test_handle_stations_event_builds_index(
+    plain_coordinator: PianobarCoordinator, mock_station_data
+) -> None:
+    """Stations event indexes stations by ID and by name."""
+    plain_coordinator._handle_stations_event(mock_station_data)
+
+    assert plain_coordinator.data["stations"] == tuple(mock_station_data)
+    index = get_station_index(plain_coordinator.data)
+    assert index is plain_coordinator.data[STATION_INDEX_KEY]
+    assert index.find("987654321")["name"] == "Test Station 2"
+    assert index.find("QuickMix")["id"] == "555555555"
+    assert index.find("missing") is None
+
+
+def test_get_station_index_duplicate_name_finds_first() -> None:
+    """Stations sharing a name resolve to the first one, like a linear scan."""
+    data = {
+        "stations": [
+            {"id": "1", "name": "Jazz"},
+            {"id": "2", "name": "Jazz"},
+        ]
+    }
 
+    index = get_station_index(data)
 
-async def test_handle_volume_event(hass: HomeAssistant) -> None:
-    """Test handling volume event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    coordinator._handle_volume_event(-10)
-    
-    assert coordinator.data["volume"] == -0.1  # Wire protocol sends -10, converted to -10/100
+    assert index.find("Jazz")["id"] == "1"
+    assert index.names == ["Jazz", "Jazz"]
 
 
-async def test_handle_play_state_event(hass: HomeAssistant) -> None:
-    """Test handling playState event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    coordinator._handle_play_state_event({"paused": True})
-    
-    assert coordinator.data["paused"] is True
+def test_get_station_index_rebuilds_when_list_replaced() -> None:
+    """Replacing data["stations"] invalidates the cached index."""
+    data = {"stations": [{"id": "1", "name": "One"}]}
+    first = get_station_index(data)
+    assert get_station_index(data) is first
 
+    data["stations"] = [{"id": "2", "name": "Two"}]
 
-async def test_handle_stations_event(hass: HomeAssistant, mock_station_data) -> None:
-    """Test handling stations event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    coordinator._handle_stations_event(mock_station_data)
-    
-    assert len(coordinator.data["stations"]) == 3
-    assert coordinator.data["stations"][0]["name"] == "Test Station 1"
+    index = get_station_index(data)
+    assert index is not first
+    assert index.find("One") is None
+    assert index.find("Two")["id"] == "2"
 
 
-async def test_send_event(hass: HomeAssistant) -> None:
+async def test_send_event(
+    coordinator: PianobarCoordinator, mock_websocket: MagicMock
+) -> None:
     """Test sending an event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    mock_ws = AsyncMock()
-    mock_ws.closed = False
-    mock_ws.send_str = AsyncMock()
-    coordinator._ws = mock_ws
+    coordinator._ws = mock_websocket
     
     await coordinator.send_event("test_event", {"key": "value"})
     
-    mock_ws.send_str.assert_called_once()
-    call_args = mock_ws.send_str.call_args[0][0]
-    assert call_args.startswith('2["test_event"')
-    assert '"key":"value"' in call_args or '"key": "value"' in call_args
+    mock_websocket.send_str.assert_called_once()
+    assert _parse_sio(mock_websocket.send_str.call_args[0][0]) == [
+        "test_event",
+        {"key": "value"},
+    ]
 
 
-async def test_send_action(hass: HomeAssistant) -> None:
+async def test_send_action(
+    coordinator: PianobarCoordinator, mock_websocket: MagicMock
+) -> None:
     """Test sending an action."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    mock_ws = AsyncMock()
-    mock_ws.closed = False
-    mock_ws.send_str = AsyncMock()
-    coordinator._ws = mock_ws
+    coordinator._ws = mock_websocket
     
     await coordinator.send_action("playback.pause")
     
-    mock_ws.send_str.assert_called_once()
-    call_args = mock_ws.send_str.call_args[0][0]
-    assert '"action"' in call_args
-    assert '"playback.pause"' in call_args
+    mock_websocket.send_str.assert_called_once()
+    assert _parse_sio(mock_websocket.send_str.call_args[0][0]) == [
+        "action",
+        "playback.pause",
+    ]
 
 
-async def test_handle_message_parse_event(hass: HomeAssistant) -> None:
+async def test_handle_message_parse_event(coordinator: PianobarCoordinator) -> None:
     """Test parsing WebSocket message."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     # Mock process event message
     message = '2["volume",-10]'
     
@@ -313,10 +432,44 @@ async def test_handle_message_parse_event(hass: HomeAssistant) -> None:
     assert coordinator.data["volume"] == -0.1  # Wire protocol sends -10, converted to -10/100
 
 
-async def test_handle_message_invalid_format(hass: HomeAssistant) -> None:
+async def test_handle_message_notifies_only_on_change(
+    coordinator: PianobarCoordinator,
+) -> None:
+    """Test listeners are notified only when an event changes state."""
+    coordinator.data["playing"] = True
+
+    with patch.object(coordinator, "async_set_updated_data") as mock_update:
+        await coordinator._handle_message('2["progress",{"elapsed":10}]')
+        assert mock_update.call_count == 1
+
+        # Same position again, a response-only event and an unknown event
+        await coordinator._handle_message('2["progress",{"elapsed":10}]')
+        await coordinator._handle_message('2["genres",{"categories":[]}]')
+        await coordinator._handle_message('2["unknown",{}]')
+        assert mock_update.call_count == 1
+
+        await coordinator._handle_message('2["volume",-10]')
+        await coordinator._handle_message('2["volume",-10]')
+        assert mock_update.call_count == 2
+
+
+def test_handle_process_event_reports_change(
+    plain_coordinator: PianobarCoordinator, mock_process_event
+) -> None:
+    """Test a repeated identical process event reports no change."""
+    assert plain_coordinator._handle_process_event(mock_process_event) is True
+    updated_at = plain_coordinator.data.get("position_updated_at")
+
+    assert plain_coordinator._handle_process_event(mock_process_event) is False
+    assert plain_coordinator.data.get("position_updated_at") == updated_at
+
+    assert plain_coordinator._handle_process_event(
+        {**mock_process_event, "paused": True}
+    )
+
+
+async def test_handle_message_invalid_format(coordinator: PianobarCoordinator) -> None:
     """Test handling invalid message format."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     # Invalid JSON
     message = '2["invalid'
     
@@ -324,10 +477,8 @@ async def test_handle_message_invalid_format(hass: HomeAssistant) -> None:
     await coordinator._handle_message(message)
 
 
-async def test_handle_message_non_event(hass: HomeAssistant) -> None:
+async def test_handle_message_non_event(coordinator: PianobarCoordinator) -> None:
     """Test handling non-event message."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     # Message type 0 (CONNECT) instead of 2 (EVENT)
     message = '0{"sid":"abc123"}'
     
@@ -335,10 +486,19 @@ async def test_handle_message_non_event(hass: HomeAssistant) -> None:
     await coordinator._handle_message(message)
 
 
-async def test_handle_song_explanation_event(hass: HomeAssistant) -> None:
+async def test_handle_message_heartbeat_ignored(
+    coordinator: PianobarCoordinator, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a bare heartbeat frame is skipped without a parse error."""
+    with patch.object(coordinator, "async_set_updated_data") as mock_update:
+        await coordinator._handle_message("2")
+
+    mock_update.assert_not_called()
+    assert "Failed to parse message" not in caplog.text
+
+
+async def test_handle_song_explanation_event(coordinator: PianobarCoordinator) -> None:
     """Test handling song.explanation event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     message = '2["song.explanation",{"explanation":"Test explanation text"}]'
     
     await coordinator._handle_message(message)
@@ -346,10 +506,8 @@ async def test_handle_song_explanation_event(hass: HomeAssistant) -> None:
     assert coordinator._response_data["song_explanation"] == "Test explanation text"
 
 
-async def test_handle_upcoming_result_event(hass: HomeAssistant) -> None:
+async def test_handle_upcoming_result_event(coordinator: PianobarCoordinator) -> None:
     """Test handling query.upcoming.result event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     upcoming_songs = [
         {"title": "Song 1", "artist": "Artist 1"},
         {"title": "Song 2", "artist": "Artist 2"},
@@ -362,10 +520,8 @@ async def test_handle_upcoming_result_event(hass: HomeAssistant) -> None:
     assert coordinator._response_data["upcoming"][0]["title"] == "Song 1"
 
 
-async def test_handle_station_info_event(hass: HomeAssistant) -> None:
+async def test_handle_station_info_event(coordinator: PianobarCoordinator) -> None:
     """Test handling stationInfo event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     station_info = {
         "artistSeeds": [{"seedId": "AS123", "name": "Test Artist"}],
         "songSeeds": [],
@@ -380,10 +536,8 @@ async def test_handle_station_info_event(hass: HomeAssistant) -> None:
     assert coordinator._response_data["station_info"]["artistSeeds"][0]["name"] == "Test Artist"
 
 
-async def test_handle_station_modes_event(hass: HomeAssistant) -> None:
+async def test_handle_station_modes_event(coordinator: PianobarCoordinator) -> None:
     """Test handling stationModes event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     modes_data = {
         "modes": [
             {"id": 0, "name": "My Station", "active": True},
@@ -398,43 +552,36 @@ async def test_handle_station_modes_event(hass: HomeAssistant) -> None:
     assert coordinator._response_data["station_modes"][0]["name"] == "My Station"
 
 
-async def test_get_response_data(hass: HomeAssistant) -> None:
+def test_get_response_data(plain_coordinator: PianobarCoordinator) -> None:
     """Test getting and clearing response data."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     # Set some response data
-    coordinator._response_data["test_key"] = "test_value"
+    plain_coordinator._response_data["test_key"] = "test_value"
     
     # Get data (should clear it)
-    result = coordinator.get_response_data("test_key")
+    result = plain_coordinator.get_response_data("test_key")
     assert result == "test_value"
     
     # Should be cleared now
-    result2 = coordinator.get_response_data("test_key")
+    result2 = plain_coordinator.get_response_data("test_key")
     assert result2 is None
 
 
-async def test_wait_for_response_timeout(hass: HomeAssistant) -> None:
+async def test_wait_for_response_timeout(coordinator: PianobarCoordinator) -> None:
     """Test waiting for response with timeout."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     # Wait for data that never arrives (short timeout)
     result = await coordinator.wait_for_response("missing_key", timeout=0.1)
     
     assert result is None
 
 
-async def test_wait_for_response_success(hass: HomeAssistant) -> None:
+async def test_wait_for_response_success(coordinator: PianobarCoordinator) -> None:
     """Test waiting for response successfully."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     # Simulate async data arrival
     async def set_data():
         await asyncio.sleep(0.05)
-        coordinator._response_data["test_key"] = "test_value"
+        coordinator._set_response("test_key", "test_value")
     
     # Start both tasks
-    import asyncio
     data_task = asyncio.create_task(set_data())
     result = await coordinator.wait_for_response("test_key", timeout=1.0)
     await data_task
@@ -442,10 +589,46 @@ async def test_wait_for_response_success(hass: HomeAssistant) -> None:
     assert result == "test_value"
 
 
-async def test_handle_search_results_event(hass: HomeAssistant) -> None:
+async def test_wait_for_response_shared_by_concurrent_waiters(
+    coordinator: PianobarCoordinator,
+) -> None:
+    """Test concurrent waiters on one key all receive the response."""
+    waiters = [
+        asyncio.create_task(coordinator.wait_for_response("genres", timeout=1.0))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    coordinator._handle_genres_event({"categories": []})
+
+    assert await asyncio.gather(*waiters) == [{"categories": []}] * 2
+    assert coordinator.get_response_data("genres") is None
+
+
+async def test_wait_for_response_ignores_stale_data(
+    coordinator: PianobarCoordinator,
+) -> None:
+    """Test a response stored before waiting is discarded."""
+    coordinator._handle_upcoming_result_event([{"title": "Old"}])
+
+    result = await coordinator.wait_for_response("upcoming", timeout=0.05)
+
+    assert result is None
+
+
+async def test_expect_response_catches_immediate_reply(
+    coordinator: PianobarCoordinator,
+) -> None:
+    """Test a reply delivered right after expect_response is not missed."""
+    response = coordinator.expect_response("upcoming")
+    coordinator._handle_upcoming_result_event([{"title": "Next"}])
+
+    result = await coordinator.async_await_response(response, timeout=0.05)
+
+    assert result == [{"title": "Next"}]
+
+
+async def test_handle_search_results_event(coordinator: PianobarCoordinator) -> None:
     """Test handling searchResults event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     search_results = {
         "categories": [
             {
@@ -471,10 +654,8 @@ async def test_handle_search_results_event(hass: HomeAssistant) -> None:
     assert coordinator._response_data["search_results"]["categories"][0]["name"] == "Artists"
 
 
-async def test_handle_genres_event(hass: HomeAssistant) -> None:
+async def test_handle_genres_event(coordinator: PianobarCoordinator) -> None:
     """Test handling genres event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
     genres_data = {
         "categories": [
             {
@@ -502,128 +683,157 @@ async def test_handle_genres_event(hass: HomeAssistant) -> None:
     assert len(coordinator._response_data["genres"]["categories"][0]["genres"]) == 2
 
 
-async def test_handle_pandora_disconnected_event(hass: HomeAssistant) -> None:
+def test_handle_pandora_disconnected_event(
+    plain_coordinator: PianobarCoordinator,
+) -> None:
     """Test handling pandora.disconnected event."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    coordinator.data["pandora_connected"] = True
-    coordinator.data["playing"] = True
-    coordinator.data["station"] = "Test Station"
-    coordinator.data["stationId"] = "123"
-    coordinator.data["song"] = {"title": "Song"}
-    coordinator.data["elapsed"] = 30
-    
-    coordinator._handle_pandora_disconnected_event({"reason": "logout"})
-    
-    assert coordinator.data["pandora_connected"] is False
-    assert coordinator.data["playing"] is False
-    assert coordinator.data["paused"] is False
-    assert coordinator.data["station"] == ""
-    assert coordinator.data["stationId"] == ""
-    assert "song" not in coordinator.data
-    assert "elapsed" not in coordinator.data
-
-
-async def test_handle_error_event_playback_play(hass: HomeAssistant) -> None:
+    plain_coordinator.data["pandora_connected"] = True
+    plain_coordinator.data["playing"] = True
+    plain_coordinator.data["station"] = "Test Station"
+    plain_coordinator.data["stationId"] = "123"
+    plain_coordinator.data["song"] = {"title": "Song"}
+    plain_coordinator.data["elapsed"] = 30
+    
+    plain_coordinator._handle_pandora_disconnected_event({"reason": "logout"})
+    
+    assert plain_coordinator.data["pandora_connected"] is False
+    assert plain_coordinator.data["playing"] is False
+    assert plain_coordinator.data["paused"] is False
+    assert plain_coordinator.data["station"] == ""
+    assert plain_coordinator.data["stationId"] == ""
+    assert "song" not in plain_coordinator.data
+    assert "elapsed" not in plain_coordinator.data
+
+
+def test_handle_error_event_playback_play(
+    plain_coordinator: PianobarCoordinator,
+) -> None:
     """Test error event for playback.play reverts playing state."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    coordinator.data["playing"] = True
-    coordinator.data["song"] = {"title": "Song"}
-    coordinator.data["elapsed"] = 10
+    plain_coordinator.data["playing"] = True
+    plain_coordinator.data["song"] = {"title": "Song"}
+    plain_coordinator.data["elapsed"] = 10
     
-    coordinator._handle_error_event({"operation": "playback.play", "message": "Failed"})
+    plain_coordinator._handle_error_event(
+        {"operation": "playback.play", "message": "Failed"}
+    )
     
-    assert coordinator.data["playing"] is False
-    assert "song" not in coordinator.data
-    assert "elapsed" not in coordinator.data
+    assert plain_coordinator.data["playing"] is False
+    assert "song" not in plain_coordinator.data
+    assert "elapsed" not in plain_coordinator.data
 
 
-async def test_handle_error_event_song_explain(hass: HomeAssistant) -> None:
+def test_handle_error_event_song_explain(
+    plain_coordinator: PianobarCoordinator,
+) -> None:
     """Test error event for song.explain stores empty explanation."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    coordinator._handle_error_event({"operation": "song.explain", "message": "No explanation"})
+    plain_coordinator._handle_error_event(
+        {"operation": "song.explain", "message": "No explanation"}
+    )
     
-    assert coordinator._response_data["song_explanation"] == ""
+    assert plain_coordinator._response_data["song_explanation"] == ""
 
 
-async def test_clear_playback_state(hass: HomeAssistant) -> None:
+def test_clear_playback_state(plain_coordinator: PianobarCoordinator) -> None:
     """Test clearing playback state."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    coordinator.data["playing"] = True
-    coordinator.data["paused"] = True
-    coordinator.data["station"] = "Test"
-    coordinator.data["stationId"] = "123"
-    coordinator.data["song"] = {"title": "Song"}
-    coordinator.data["elapsed"] = 45
+    plain_coordinator.data["playing"] = True
+    plain_coordinator.data["paused"] = True
+    plain_coordinator.data["station"] = "Test"
+    plain_coordinator.data["stationId"] = "123"
+    plain_coordinator.data["song"] = {"title": "Song"}
+    plain_coordinator.data["elapsed"] = 45
     
-    coordinator._clear_playback_state()
+    plain_coordinator._clear_playback_state()
     
-    assert coordinator.data["playing"] is False
-    assert coordinator.data["paused"] is False
-    assert coordinator.data["station"] is None
-    assert coordinator.data["stationId"] is None
-    assert "song" not in coordinator.data
-    assert "elapsed" not in coordinator.data
+    assert plain_coordinator.data["playing"] is False
+    assert plain_coordinator.data["paused"] is False
+    assert plain_coordinator.data["station"] is None
+    assert plain_coordinator.data["stationId"] is None
+    assert "song" not in plain_coordinator.data
+    assert "elapsed" not in plain_coordinator.data
 
 
-async def test_send_action_with_params(hass: HomeAssistant) -> None:
+async def test_send_action_with_params(
+    coordinator: PianobarCoordinator, mock_websocket: MagicMock
+) -> None:
     """Test sending an action with parameters."""
-    coordinator = PianobarCoordinator(hass, "127.0.0.1", 3000)
-    
-    mock_ws = AsyncMock()
-    mock_ws.closed = False
-    mock_ws.send_str = AsyncMock()
-    coordinator._ws = mock_ws
+    coordinator._ws = mock_websocket
     
     await coordinator.send_action_with_params("volume.set", {"volume": 50})
     
-    mock_ws.send_str.assert_called_once()
-    call_args = mock_ws.send_str.call_args[0][0]
-    assert "action" in call_args or "volume.set" in call_args
-    assert "50" in call_args
+    mock_websocket.send_str.assert_called_once()
+    assert _parse_sio(mock_websocket.send_str.call_args[0][0]) == [
+        "action",
+        {"action": "volume.set", "volume": 50},
+    ]
 
 
-def test_handle_process_event_sets_initial_event(hass: HomeAssistant) -> None:
+def test_handle_process_event_sets_initial_event(
+    plain_coordinator: PianobarCoordinator,
+) -> None:
     """_handle_process_event sets _initial_process_event for async_connect wait."""
-    coord = PianobarCoordinator(hass, "127.0.0.1", 8080)
-    coord._initial_process_event.clear()
-    assert not coord._initial_process_event.is_set()
-    coord._handle_process_event(
+    plain_coordinator._initial_process_event.clear()
+    assert not plain_coordinator._initial_process_event.is_set()
+    plain_coordinator._handle_process_event(
         {"playing": False, "paused": False, "volume": 0, "station": "", "stationId": ""}
     )
-    assert coord._initial_process_event.is_set()
+    assert plain_coordinator._initial_process_event.is_set()
 
 
 async def test_async_connect_continues_if_process_times_out(
-    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+    coordinator: PianobarCoordinator,
+    patched_session: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    mock_websocket: MagicMock,
 ) -> None:
     """If no process arrives, async_connect logs a warning and still returns."""
-    coord = PianobarCoordinator(hass, "127.0.0.1", 8080)
-    mock_ws = MagicMock()
-    mock_ws.closed = False
-    mock_ws.send_str = AsyncMock()
-    mock_ws.close = AsyncMock()
 
     async def fake_listen_never_emits_process() -> None:
         await asyncio.sleep(1.0)
 
-    with patch("custom_components.pianobar.coordinator.aiohttp.ClientSession") as mock_session_cls:
-        mock_session = MagicMock()
-        mock_session.closed = False
-        mock_session.close = AsyncMock()
-        mock_session.ws_connect = AsyncMock(return_value=mock_ws)
-        mock_session_cls.return_value = mock_session
-
-        with patch.object(coord, "_listen", new=fake_listen_never_emits_process):
-            with patch(
-                "custom_components.pianobar.coordinator.INITIAL_PROCESS_TIMEOUT", 0.05
-            ):
-                with caplog.at_level(
-                    logging.WARNING, logger="custom_components.pianobar.coordinator"
-                ):
-                    await coord.async_connect()
-
-    assert not coord._initial_process_event.is_set()
+    patched_session.ws_connect.return_value = mock_websocket
+    monkeypatch.setattr(coordinator, "_listen", fake_listen_never_emits_process)
+    monkeypatch.setattr(
+        "custom_components.pianobar.coordinator.INITIAL_PROCESS_TIMEOUT", 0.05
+    )
+
+    with caplog.at_level(
+        logging.WARNING, logger="custom_components.pianobar.coordinator"
+    ):
+        await coordinator.async_connect()
+
+    assert not coordinator._initial_process_event.is_set()
     assert "No process event received" in caplog.text
-    await coord.async_disconnect()
+    await coordinator.async_disconnect()
+
 
+async def test_reconnect_stops_when_closing(coordinator: PianobarCoordinator) -> None:
+    """The reconnect backoff ends as soon as the coordinator starts closing."""
+    coordinator._reconnect_delay = 100
+
+    with patch.object(coordinator, "async_connect", new=AsyncMock()) as mock_connect:
+        task = asyncio.create_task(coordinator._reconnect())
+        await asyncio.sleep(0)
+        coordinator._closing.set()
+        await asyncio.wait_for(task, timeout=1)
+
+    mock_connect.assert_not_called()
+
+
+def test_jittered_reconnect_delay_is_capped(
+    plain_coordinator: PianobarCoordinator,
+) -> None:
+    """Jitter never pushes the reconnect delay past WS_MAX_RECONNECT_DELAY."""
+    plain_coordinator._reconnect_delay = WS_MAX_RECONNECT_DELAY
+
+    with patch(
+        "custom_components.pianobar.coordinator.random.random", return_value=0.99
+    ):
+        highest = plain_coordinator._jittered_reconnect_delay()
+    with patch(
+        "custom_components.pianobar.coordinator.random.random", return_value=0.0
+    ):
+        lowest = plain_coordinator._jittered_reconnect_delay()
+
+    assert highest == WS_MAX_RECONNECT_DELAY
+    assert lowest == WS_MAX_RECONNECT_DELAY / 2
@@ -1,17 +1,22 @@
 """Test the Pianobar integration init."""
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from functools import partial
+import json
+from typing import Any, Final
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-import custom_components.pianobar as pianobar_integration
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ServiceValidationError
+from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
 from homeassistant.helpers import entity_registry as er
 
+import custom_components.pianobar as pianobar_integration
+from custom_components.pianobar import PianobarServices
 from custom_components.pianobar.const import (
     DOMAIN,
     SERVICE_ADD_SEED,
@@ -38,826 +43,402 @@ from custom_components.pianobar.const import (
     SERVICE_TIRED_OF_SONG,
     SERVICE_TOGGLE_PLAYBACK,
 )
+from custom_components.pianobar.coordinator import (
+    PianobarCoordinator,
+    get_station_index,
+)
+
+ServiceCaller = Callable[..., Awaitable[Any]]
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.usefixtures("enable_custom_integrations"),
+]
+
+
+def _parse_sio(message: str) -> list:
+    """Decode a Socket.IO event frame sent by the coordinator."""
+    assert message.startswith("2")
+    return json.loads(message[1:])
+
+
+# Canned backend responses, keyed by the response the service waits for
+RESPONSES: Final = {
+    "song_explanation": "Test explanation",
+    "upcoming": [{"title": "Test Song"}],
+    "station_info": {"artistSeeds": [], "songSeeds": []},
+    "station_modes": [{"id": 0, "name": "My Station"}],
+    "search_results": {
+        "categories": [
+            {
+                "name": "Artists",
+                "results": [{"name": "Test Artist", "musicId": "R123"}],
+            }
+        ]
+    },
+    "genres": {
+        "categories": [
+            {
+                "name": "Rock",
+                "genres": [{"name": "Classic Rock", "musicId": "G100"}],
+            }
+        ]
+    },
+}
+
+
+@pytest.fixture
+def call_service(hass: HomeAssistant) -> ServiceCaller:
+    """Return a blocking service call bound to the Pianobar domain."""
+    return partial(hass.services.async_call, DOMAIN, blocking=True)
+
+
+@pytest.fixture
+def mock_coordinator(mock_coordinator: MagicMock) -> MagicMock:
+    """Answer expected responses from RESPONSES."""
+    # The canned response stands in for the future expect_response returns
+    mock_coordinator.expect_response.side_effect = RESPONSES.get
+    mock_coordinator.async_await_response.side_effect = (
+        lambda response, *args, **kwargs: response
+    )
+    return mock_coordinator
 
 
+@pytest.fixture
+def services(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_coordinator: MagicMock,
+) -> PianobarServices:
+    """Return the service handlers with mock_coordinator as the only instance."""
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_coordinator}
+    return PianobarServices(hass)
+
+
+@pytest.mark.usefixtures("setup_integration")
+@pytest.mark.parametrize("platforms", [pianobar_integration.PLATFORMS])
 async def test_async_setup_entry(
     hass: HomeAssistant,
     mock_config_entry: ConfigEntry,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Test setting up the integration."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        assert DOMAIN in hass.data
-        assert mock_config_entry.entry_id in hass.data[DOMAIN]
-        
-        # Check services are registered
-        assert hass.services.has_service(DOMAIN, SERVICE_LOVE_SONG)
-        assert hass.services.has_service(DOMAIN, SERVICE_BAN_SONG)
-        assert hass.services.has_service(DOMAIN, SERVICE_TIRED_OF_SONG)
-        assert hass.services.has_service(DOMAIN, SERVICE_CREATE_STATION)
-        assert hass.services.has_service(DOMAIN, SERVICE_RENAME_STATION)
-        assert hass.services.has_service(DOMAIN, SERVICE_DELETE_STATION)
+    assert DOMAIN in hass.data
+    assert mock_config_entry.entry_id in hass.data[DOMAIN]
+
+    # Check services are registered
+    assert hass.services.has_service(DOMAIN, SERVICE_LOVE_SONG)
+    assert hass.services.has_service(DOMAIN, SERVICE_BAN_SONG)
+    assert hass.services.has_service(DOMAIN, SERVICE_TIRED_OF_SONG)
+    assert hass.services.has_service(DOMAIN, SERVICE_CREATE_STATION)
+    assert hass.services.has_service(DOMAIN, SERVICE_RENAME_STATION)
+    assert hass.services.has_service(DOMAIN, SERVICE_DELETE_STATION)
+
+    # Both platforms were forwarded
+    assert hass.states.get("media_player.pianobar") is not None
+    assert hass.states.get("select.pianobar_station") is not None
 
 
 async def test_async_setup_entry_connection_error(
     hass: HomeAssistant,
     mock_config_entry: ConfigEntry,
+    mock_coordinator: MagicMock,
 ) -> None:
-    """Test setup with connection error."""
-    mock_config_entry.add_to_hass(hass)
-    
+    """Test a failed connection raises ConfigEntryNotReady."""
+    mock_coordinator.async_connect.side_effect = Exception("Connection failed")
+
     with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock(side_effect=Exception("Connection failed"))
-        
-        assert not await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        "custom_components.pianobar.PianobarCoordinator",
+        new=MagicMock(spec=PianobarCoordinator, return_value=mock_coordinator),
+    ), pytest.raises(ConfigEntryNotReady):
+        await pianobar_integration.async_setup_entry(hass, mock_config_entry)
+
+    assert mock_config_entry.entry_id not in hass.data.get(DOMAIN, {})
 
 
+@pytest.mark.usefixtures("setup_integration")
+@pytest.mark.parametrize("platforms", [pianobar_integration.PLATFORMS])
 async def test_async_unload_entry(
     hass: HomeAssistant,
     mock_config_entry: ConfigEntry,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Test unloading the integration."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.async_disconnect = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        mock_coordinator.async_disconnect.assert_called_once()
-        assert mock_config_entry.entry_id not in hass.data[DOMAIN]
-
-
-async def test_service_love_song(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test love_song service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_action = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_LOVE_SONG,
-            {},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_action.assert_called_once_with("song.love")
-
-
-async def test_service_ban_song(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test ban_song service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_action = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_BAN_SONG,
-            {},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_action.assert_called_once_with("song.ban")
-
-
-async def test_service_tired_of_song(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+    mock_coordinator.async_disconnect.assert_called_once()
+    assert mock_config_entry.entry_id not in hass.data[DOMAIN]
+
+
+# (service, service data, expected action)
+ACTION_CASES: Final = [
+    (SERVICE_LOVE_SONG, {}, "song.love"),
+    (SERVICE_BAN_SONG, {}, "song.ban"),
+    (SERVICE_TIRED_OF_SONG, {}, "song.tired"),
+    (SERVICE_TOGGLE_PLAYBACK, {}, "playback.toggle"),
+    (SERVICE_RESET_VOLUME, {}, "volume.reset"),
+]
+
+# (service, service data, expected event, expected payload)
+EVENT_CASES: Final = [
+    (
+        SERVICE_RENAME_STATION,
+        {"station_id": "123", "name": "New Name"},
+        "station.rename",
+        {"stationId": "123", "newName": "New Name"},
+    ),
+    (SERVICE_DELETE_STATION, {"station_id": "123"}, "station.delete", "123"),
+    (
+        SERVICE_SET_QUICK_MIX,
+        {"station_ids": ["123", "456"]},
+        "station.setQuickMix",
+        ["123", "456"],
+    ),
+    (
+        SERVICE_ADD_SEED,
+        {"music_id": "M123", "station_id": "S456"},
+        "station.addMusic",
+        {"musicId": "M123", "stationId": "S456"},
+    ),
+    (
+        SERVICE_DELETE_SEED,
+        {"seed_id": "AS123", "seed_type": "artist", "station_id": "S456"},
+        "station.deleteSeed",
+        {"seedId": "AS123", "seedType": "artist", "stationId": "S456"},
+    ),
+    (
+        SERVICE_DELETE_FEEDBACK,
+        {"feedback_id": "FB123", "station_id": "S456"},
+        "station.deleteFeedback",
+        {"feedbackId": "FB123", "stationId": "S456"},
+    ),
+    (
+        SERVICE_SET_STATION_MODE,
+        {"station_id": "123", "mode_id": 2},
+        "station.setMode",
+        {"stationId": "123", "modeId": 2},
+    ),
+    (
+        SERVICE_CREATE_STATION_FROM_MUSIC_ID,
+        {"music_id": "G100"},
+        "station.addGenre",
+        {"musicId": "G100"},
+    ),
+    (
+        SERVICE_ADD_SHARED_STATION,
+        {"station_id": "1234567890"},
+        "station.addShared",
+        {"stationId": "1234567890"},
+    ),
+]
+
+
+@pytest.mark.usefixtures("setup_integration_ws")
+@pytest.mark.parametrize(("service", "data", "action"), ACTION_CASES)
+async def test_action_services(
+    call_service: ServiceCaller,
+    mock_websocket: MagicMock,
+    service: str,
+    data: dict,
+    action: str,
+) -> None:
+    """Test services that send a bare action."""
+    await call_service(service, data)
+
+    mock_websocket.send_str.assert_called_once()
+    assert _parse_sio(mock_websocket.send_str.call_args[0][0]) == ["action", action]
+
+
+@pytest.mark.usefixtures("setup_integration_ws")
+@pytest.mark.parametrize(("service", "data", "event", "payload"), EVENT_CASES)
+async def test_event_services(
+    call_service: ServiceCaller,
+    mock_websocket: MagicMock,
+    service: str,
+    data: dict,
+    event: str,
+    payload: Any,
+) -> None:
+    """Test services that send an event with the expected payload."""
+    await call_service(service, data)
+
+    mock_websocket.send_str.assert_called_once()
+    assert _parse_sio(mock_websocket.send_str.call_args[0][0]) == [event, payload]
+
+
+async def test_service_switch_account(
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
 ) -> None:
-    """Test tired_of_song service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_action = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_TIRED_OF_SONG,
-            {},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_action.assert_called_once_with("song.tired")
+    """switch_account service sends app.pandora-reconnect with account_id."""
+    await services.async_switch_account(
+        ServiceCall(DOMAIN, SERVICE_SWITCH_ACCOUNT, {"account_id": "work"})
+    )
+
+    mock_coordinator.send_action_with_params.assert_called_once_with(
+        "app.pandora-reconnect", {"account_id": "work"}
+    )
 
 
 async def test_service_reconnect(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Test reconnect service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.is_connected = False
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_RECONNECT,
-            {},
-            blocking=True,
-        )
-        
-        # Should call async_connect when not connected
-        assert mock_coordinator.async_connect.call_count == 2  # Once during setup, once for reconnect
+    mock_coordinator.is_connected = False
+
+    await services.async_reconnect(ServiceCall(DOMAIN, SERVICE_RECONNECT, {}))
+
+    # Should call async_connect when not connected
+    mock_coordinator.async_connect.assert_awaited_once()
 
 
 async def test_service_reconnect_async_connect_raises(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Reconnect service logs error when async_connect fails."""
-    mock_config_entry.add_to_hass(hass)
+    mock_coordinator.async_connect.side_effect = RuntimeError("connection refused")
+    mock_coordinator.is_connected = False
 
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock(
-            side_effect=[None, RuntimeError("connection refused")]
-        )
-        mock_coordinator.is_connected = False
-        mock_coordinator.data = {"playing": False}
+    await services.async_reconnect(ServiceCall(DOMAIN, SERVICE_RECONNECT, {}))
 
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_RECONNECT,
-            {},
-            blocking=True,
-        )
-
-        assert mock_coordinator.async_connect.call_count == 2
+    mock_coordinator.async_connect.assert_awaited_once()
 
 
 async def test_service_create_station(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Test create_station service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {
-            "playing": True,
-            "song": {"trackToken": "test_token"},
-        }
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_CREATE_STATION,
-            {"type": "artist"},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        call_args = mock_coordinator.send_event.call_args[0]
-        assert call_args[0] == "station.createFrom"
-        assert call_args[1]["trackToken"] == "test_token"
-        assert call_args[1]["type"] == "artist"
+    mock_coordinator.data = {
+        "playing": True,
+        "song": {"trackToken": "test_token"},
+    }
+
+    await services.async_create_station(
+        ServiceCall(DOMAIN, SERVICE_CREATE_STATION, {"type": "artist"})
+    )
+
+    mock_coordinator.send_event.assert_called_once()
+    call_args = mock_coordinator.send_event.call_args[0]
+    assert call_args[0] == "station.createFrom"
+    assert call_args[1]["trackToken"] == "test_token"
+    assert call_args[1]["type"] == "artist"
 
 
 async def test_service_create_station_without_track_token(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
 ) -> None:
     """create_station does nothing when no track token is available."""
-    mock_config_entry.add_to_hass(hass)
-
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_CREATE_STATION,
-            {"type": "song"},
-            blocking=True,
-        )
+    await services.async_create_station(
+        ServiceCall(DOMAIN, SERVICE_CREATE_STATION, {"type": "song"})
+    )
 
-        mock_coordinator.send_event.assert_not_called()
-
-
-async def test_service_rename_station(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test rename_station service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_RENAME_STATION,
-            {"station_id": "123", "name": "New Name"},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        call_args = mock_coordinator.send_event.call_args[0]
-        assert call_args[0] == "station.rename"
-        assert call_args[1]["stationId"] == "123"
-        assert call_args[1]["newName"] == "New Name"
-
-
-async def test_service_delete_station(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test delete_station service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_DELETE_STATION,
-            {"station_id": "123"},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        call_args = mock_coordinator.send_event.call_args[0]
-        assert call_args[0] == "station.delete"
-        assert call_args[1] == "123"
+    mock_coordinator.send_event.assert_not_called()
 
 
+@pytest.mark.usefixtures("setup_integration")
 async def test_service_explain_song(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    call_service: ServiceCaller,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Test explain_song service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_action = AsyncMock()
-        mock_coordinator.wait_for_response = AsyncMock(return_value="Test explanation")
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        response = await hass.services.async_call(
-            DOMAIN,
-            SERVICE_EXPLAIN_SONG,
-            {},
-            blocking=True,
-            return_response=True,
-        )
-        
-        mock_coordinator.send_action.assert_called_once_with("song.explain")
-        assert response["explanation"] == "Test explanation"
+    response = await call_service(SERVICE_EXPLAIN_SONG, {}, return_response=True)
+
+    mock_coordinator.send_action.assert_called_once_with("song.explain")
+    assert response["explanation"] == "Test explanation"
 
 
 async def test_service_get_upcoming(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Test get_upcoming service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_action = AsyncMock()
-        mock_coordinator.wait_for_response = AsyncMock(return_value=[{"title": "Test Song"}])
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        response = await hass.services.async_call(
-            DOMAIN,
-            SERVICE_GET_UPCOMING,
-            {},
-            blocking=True,
-            return_response=True,
-        )
-        
-        mock_coordinator.send_action.assert_called_once_with("query.upcoming")
-        assert len(response["songs"]) == 1
-
-
-async def test_service_set_quick_mix(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test set_quick_mix service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_SET_QUICK_MIX,
-            {"station_ids": ["123", "456"]},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once_with(
-            "station.setQuickMix", ["123", "456"]
-        )
-
-
-async def test_service_add_seed(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test add_seed service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_ADD_SEED,
-            {"music_id": "M123", "station_id": "S456"},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        call_args = mock_coordinator.send_event.call_args[0]
-        assert call_args[0] == "station.addMusic"
-        assert call_args[1]["musicId"] == "M123"
-        assert call_args[1]["stationId"] == "S456"
+    response = await services.async_get_upcoming(
+        ServiceCall(DOMAIN, SERVICE_GET_UPCOMING, {})
+    )
+
+    mock_coordinator.send_action.assert_called_once_with("query.upcoming")
+    assert len(response["songs"]) == 1
+
+
+async def test_async_request_expects_before_sending() -> None:
+    """Test the response is expected before the request goes out."""
+    calls: list[str] = []
+    coordinator = MagicMock()
+    coordinator.expect_response.side_effect = (
+        lambda key: calls.append(f"expect:{key}") or "future"
+    )
+    coordinator.async_await_response = AsyncMock(return_value="result")
+
+    async def _send() -> None:
+        calls.append("send")
+
+    result = await pianobar_integration._async_request(
+        coordinator, "upcoming", _send()
+    )
+
+    assert result == "result"
+    assert calls == ["expect:upcoming", "send"]
+    coordinator.async_await_response.assert_awaited_once_with("future")
 
 
 async def test_service_get_station_info(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Test get_station_info service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.wait_for_response = AsyncMock(
-            return_value={"artistSeeds": [], "songSeeds": []}
-        )
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        response = await hass.services.async_call(
-            DOMAIN,
-            SERVICE_GET_STATION_INFO,
-            {"station_id": "123"},
-            blocking=True,
-            return_response=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        assert "artistSeeds" in response
-
-
-async def test_service_delete_seed(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test delete_seed service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_DELETE_SEED,
-            {"seed_id": "AS123", "seed_type": "artist", "station_id": "S456"},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        call_args = mock_coordinator.send_event.call_args[0]
-        assert call_args[0] == "station.deleteSeed"
-
-
-async def test_service_delete_feedback(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test delete_feedback service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_DELETE_FEEDBACK,
-            {"feedback_id": "FB123", "station_id": "S456"},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        call_args = mock_coordinator.send_event.call_args[0]
-        assert call_args[0] == "station.deleteFeedback"
+    response = await services.async_get_station_info(
+        ServiceCall(DOMAIN, SERVICE_GET_STATION_INFO, {"station_id": "123"})
+    )
+
+    mock_coordinator.send_event.assert_called_once()
+    assert "artistSeeds" in response
 
 
 async def test_service_get_station_modes(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Test get_station_modes service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.wait_for_response = AsyncMock(return_value=[{"id": 0, "name": "My Station"}])
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        response = await hass.services.async_call(
-            DOMAIN,
-            SERVICE_GET_STATION_MODES,
-            {"station_id": "123"},
-            blocking=True,
-            return_response=True,
-        )
-        
-        assert len(response["modes"]) == 1
-
-
-async def test_service_set_station_mode(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test set_station_mode service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_SET_STATION_MODE,
-            {"station_id": "123", "mode_id": 2},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        call_args = mock_coordinator.send_event.call_args[0]
-        assert call_args[0] == "station.setMode"
-        assert call_args[1]["modeId"] == 2
-
-
-async def test_service_toggle_playback(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test toggle_playback service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_action = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_TOGGLE_PLAYBACK,
-            {},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_action.assert_called_once_with("playback.toggle")
-
-
-async def test_service_reset_volume(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test reset_volume service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_action = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_RESET_VOLUME,
-            {},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_action.assert_called_once_with("volume.reset")
+    response = await services.async_get_station_modes(
+        ServiceCall(DOMAIN, SERVICE_GET_STATION_MODES, {"station_id": "123"})
+    )
+
+    assert len(response["modes"]) == 1
 
 
 async def test_service_search(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Test search service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.wait_for_response = AsyncMock(
-            return_value={
-                "categories": [
-                    {
-                        "name": "Artists",
-                        "results": [{"name": "Test Artist", "musicId": "R123"}]
-                    }
-                ]
-            }
-        )
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        response = await hass.services.async_call(
-            DOMAIN,
-            SERVICE_SEARCH,
-            {"query": "Test Artist"},
-            blocking=True,
-            return_response=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        call_args = mock_coordinator.send_event.call_args[0]
-        assert call_args[0] == "music.search"
-        assert call_args[1]["query"] == "Test Artist"
-        assert "categories" in response
-        assert len(response["categories"]) == 1
+    response = await services.async_search(
+        ServiceCall(DOMAIN, SERVICE_SEARCH, {"query": "Test Artist"})
+    )
+
+    mock_coordinator.send_event.assert_called_once()
+    call_args = mock_coordinator.send_event.call_args[0]
+    assert call_args[0] == "music.search"
+    assert call_args[1]["query"] == "Test Artist"
+    assert "categories" in response
+    assert len(response["categories"]) == 1
 
 
 async def test_service_get_genres(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
 ) -> None:
     """Test get_genres service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.wait_for_response = AsyncMock(
-            return_value={
-                "categories": [
-                    {
-                        "name": "Rock",
-                        "genres": [{"name": "Classic Rock", "musicId": "G100"}]
-                    }
-                ]
-            }
-        )
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        response = await hass.services.async_call(
-            DOMAIN,
-            SERVICE_GET_GENRES,
-            {},
-            blocking=True,
-            return_response=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once_with("station.getGenres", {})
-        assert "categories" in response
-        assert len(response["categories"]) == 1
-
-
-async def test_service_create_station_from_music_id(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test create_station_from_music_id service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_CREATE_STATION_FROM_MUSIC_ID,
-            {"music_id": "G100"},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        call_args = mock_coordinator.send_event.call_args[0]
-        assert call_args[0] == "station.addGenre"
-        assert call_args[1]["musicId"] == "G100"
-
-
-async def test_service_add_shared_station(
-    hass: HomeAssistant,
-    mock_config_entry: ConfigEntry,
-) -> None:
-    """Test add_shared_station service."""
-    mock_config_entry.add_to_hass(hass)
-    
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_event = AsyncMock()
-        mock_coordinator.data = {"playing": False}
-        
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-        
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_ADD_SHARED_STATION,
-            {"station_id": "1234567890"},
-            blocking=True,
-        )
-        
-        mock_coordinator.send_event.assert_called_once()
-        call_args = mock_coordinator.send_event.call_args[0]
-        assert call_args[0] == "station.addShared"
-        assert call_args[1]["stationId"] == "1234567890"
+    response = await services.async_get_genres(
+        ServiceCall(DOMAIN, SERVICE_GET_GENRES, {})
+    )
+
+    mock_coordinator.send_event.assert_called_once_with("station.getGenres", {})
+    assert "categories" in response
+    assert len(response["categories"]) == 1
 
 
 def test_get_coordinator_from_call_uses_first_entry_when_no_entity_id(
@@ -903,7 +484,6 @@ async def test_get_coordinator_from_call_resolves_entity_id(
         suggested_object_id="pianobar_test_player",
         config_entry=mock_config_entry,
     )
-    await hass.async_block_till_done()
 
     call = ServiceCall(
         DOMAIN,
@@ -921,71 +501,114 @@ async def test_get_coordinator_from_call_resolves_entity_id(
 
 
 async def test_service_reconnect_when_already_connected(
+    services: PianobarServices,
+    mock_coordinator: MagicMock,
+) -> None:
+    """Reconnect service does not call async_connect when already connected."""
+    mock_coordinator.is_connected = True
+
+    await services.async_reconnect(ServiceCall(DOMAIN, SERVICE_RECONNECT, {}))
+
+    mock_coordinator.async_connect.assert_not_called()
+
+
+async def test_async_reload_entry(
     hass: HomeAssistant,
     mock_config_entry: ConfigEntry,
 ) -> None:
-    """Reconnect service does not call async_connect when already connected."""
-    mock_config_entry.add_to_hass(hass)
+    """Options update listener reloads when the entry has no coordinator."""
+    with patch.object(
+        hass.config_entries, "async_reload", new=AsyncMock()
+    ) as mock_reload:
+        await pianobar_integration.async_reload_entry(hass, mock_config_entry)
+        mock_reload.assert_awaited_once_with(mock_config_entry.entry_id)
 
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.is_connected = True
-        mock_coordinator.data = {"playing": False}
 
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
+async def test_async_reload_entry_unchanged_host_port(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    mock_coordinator,
+) -> None:
+    """Options update with the same host/port neither reconnects nor reloads."""
+    mock_coordinator.host = mock_config_entry.data[CONF_HOST]
+    mock_coordinator.port = mock_config_entry.data[CONF_PORT]
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_coordinator}
 
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_RECONNECT,
-            {},
-            blocking=True,
-        )
+    with patch.object(
+        hass.config_entries, "async_reload", new=AsyncMock()
+    ) as mock_reload:
+        await pianobar_integration.async_reload_entry(hass, mock_config_entry)
 
-        assert mock_coordinator.async_connect.call_count == 1
+    mock_reload.assert_not_awaited()
+    mock_coordinator.async_disconnect.assert_not_awaited()
 
 
-async def test_service_switch_account(
+async def test_async_reload_entry_host_changed_reconnects(
     hass: HomeAssistant,
     mock_config_entry: ConfigEntry,
+    mock_coordinator,
 ) -> None:
-    """switch_account service sends app.pandora-reconnect with account_id."""
-    mock_config_entry.add_to_hass(hass)
+    """Options update with a new host reconnects the coordinator in place."""
+    mock_coordinator.host = "10.0.0.99"
+    mock_coordinator.port = mock_config_entry.data[CONF_PORT]
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_coordinator}
 
-    with patch(
-        "custom_components.pianobar.PianobarCoordinator"
-    ) as mock_coordinator_class:
-        mock_coordinator = mock_coordinator_class.return_value
-        mock_coordinator.async_connect = AsyncMock()
-        mock_coordinator.send_action_with_params = AsyncMock()
-        mock_coordinator.data = {"playing": False}
+    with patch.object(
+        hass.config_entries, "async_reload", new=AsyncMock()
+    ) as mock_reload:
+        await pianobar_integration.async_reload_entry(hass, mock_config_entry)
 
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
+    mock_reload.assert_not_awaited()
+    mock_coordinator.async_disconnect.assert_awaited_once()
+    mock_coordinator.reset_server_state.assert_called_once()
+    mock_coordinator.async_connect.assert_awaited_once()
+    assert mock_coordinator.host == mock_config_entry.data[CONF_HOST]
 
-        await hass.services.async_call(
-            DOMAIN,
-            SERVICE_SWITCH_ACCOUNT,
-            {"account_id": "work"},
-            blocking=True,
-        )
 
-        mock_coordinator.send_action_with_params.assert_called_once_with(
-            "app.pandora-reconnect", {"account_id": "work"}
-        )
+async def test_async_reload_entry_host_changed_drops_old_server_state(
+    hass: HomeAssistant,
+    mock_config_entry: ConfigEntry,
+    setup_integration_ws: PianobarCoordinator,
+    mock_station_data,
+    mock_song_data,
+) -> None:
+    """Reconnecting to another server does not keep the old server's state."""
+    coordinator = setup_integration_ws
+    coordinator._handle_stations_event(list(mock_station_data))
+    coordinator._handle_start_event(dict(mock_song_data))
+    coordinator.data["accounts"] = [{"id": "old"}]
+    coordinator.data["current_account"] = "old"
 
+    hass.config_entries.async_update_entry(
+        mock_config_entry, data={CONF_HOST: "10.0.0.99", CONF_PORT: 3000}
+    )
+    # The entry's update listener reconnects in place
+    await hass.async_block_till_done()
 
-async def test_async_reload_entry(
+    assert coordinator is hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert coordinator.host == "10.0.0.99"
+    assert coordinator.data["stations"] == ()
+    assert get_station_index(coordinator.data).by_id == {}
+    assert "song" not in coordinator.data
+    assert "elapsed" not in coordinator.data
+    assert "accounts" not in coordinator.data
+    assert "current_account" not in coordinator.data
+
+
+async def test_async_reload_entry_reconnect_failure_reloads(
     hass: HomeAssistant,
     mock_config_entry: ConfigEntry,
+    mock_coordinator,
 ) -> None:
-    """Options update listener triggers config entry reload."""
+    """A failed in-place reconnect falls back to a full reload."""
+    mock_coordinator.host = "10.0.0.99"
+    mock_coordinator.port = mock_config_entry.data[CONF_PORT]
+    mock_coordinator.async_connect.side_effect = ConnectionError("boom")
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: mock_coordinator}
+
     with patch.object(
         hass.config_entries, "async_reload", new=AsyncMock()
     ) as mock_reload:
         await pianobar_integration.async_reload_entry(hass, mock_config_entry)
-        mock_reload.assert_awaited_once_with(mock_config_entry.entry_id)
 
+    mock_reload.assert_awaited_once_with(mock_config_entry.entry_id)
@@ -1,7 +1,8 @@
 """Test the Pianobar media player."""
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Final
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -10,54 +11,78 @@ from homeassistant.components.media_player import (
     MediaPlayerState,
     MediaType,
 )
-from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
 
-from custom_components.pianobar.const import DOMAIN, MEDIA_TYPE_STATION
+from custom_components.pianobar.const import MEDIA_TYPE_STATION
 from custom_components.pianobar.media_player import PianobarMediaPlayer
 
+pytestmark = pytest.mark.unit
+
+# Features the player must advertise (it may advertise more)
+EXPECTED_FEATURES: Final = (
+    MediaPlayerEntityFeature.PAUSE
+    | MediaPlayerEntityFeature.PLAY
+    | MediaPlayerEntityFeature.VOLUME_SET
+    | MediaPlayerEntityFeature.VOLUME_STEP
+    | MediaPlayerEntityFeature.NEXT_TRACK
+    | MediaPlayerEntityFeature.SELECT_SOURCE
+    | MediaPlayerEntityFeature.BROWSE_MEDIA
+    | MediaPlayerEntityFeature.PLAY_MEDIA
+)
 
-async def test_media_player_state_idle(
-    hass: HomeAssistant,
-    mock_config_entry,
-    mock_coordinator,
-) -> None:
-    """Test media player idle state."""
-    mock_coordinator.data = {"playing": False, "paused": False, "station": "Test Station"}
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    assert player.state == MediaPlayerState.IDLE
 
-
-async def test_media_player_state_playing(
-    hass: HomeAssistant,
-    mock_config_entry,
-    mock_coordinator,
-) -> None:
-    """Test media player playing state."""
-    mock_coordinator.data = {"playing": True, "paused": False, "station": "Test Station"}
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    assert player.state == MediaPlayerState.PLAYING
+@pytest.fixture
+def coordinator_data(request: pytest.FixtureRequest) -> dict | None:
+    """Coordinator data for the player fixture, set via indirect parametrize."""
+    return getattr(request, "param", None)
 
 
-async def test_media_player_state_paused(
-    hass: HomeAssistant,
+@pytest.fixture
+def player(
     mock_config_entry,
     mock_coordinator,
+    coordinator_data: dict | None,
+) -> PianobarMediaPlayer:
+    """Media player on mock_coordinator, built after coordinator_data is set."""
+    if coordinator_data is not None:
+        mock_coordinator.data = coordinator_data
+    return PianobarMediaPlayer(mock_coordinator, mock_config_entry)
+
+
+@pytest.mark.parametrize(
+    ("coordinator_data", "expected"),
+    [
+        pytest.param(
+            {"playing": False, "paused": False, "station": "Test Station"},
+            MediaPlayerState.IDLE,
+            id="idle",
+        ),
+        pytest.param(
+            {"playing": True, "paused": False, "station": "Test Station"},
+            MediaPlayerState.PLAYING,
+            id="playing",
+        ),
+        pytest.param(
+            {"playing": True, "paused": True, "station": "Test Station"},
+            MediaPlayerState.PAUSED,
+            id="paused",
+        ),
+        pytest.param(
+            {"playing": False, "paused": False, "station": ""},
+            MediaPlayerState.OFF,
+            id="off-no-station",
+        ),
+    ],
+    indirect=["coordinator_data"],
+)
+def test_media_player_state(
+    player: PianobarMediaPlayer,
+    expected: MediaPlayerState,
 ) -> None:
-    """Test media player paused state."""
-    mock_coordinator.data = {"playing": True, "paused": True, "station": "Test Station"}
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    assert player.state == MediaPlayerState.PAUSED
+    """Test media player state follows the coordinator data."""
+    assert player.state == expected
 
 
-async def test_media_player_volume_level(
-    hass: HomeAssistant,
+def test_media_player_volume_level(
     mock_config_entry,
     mock_coordinator,
 ) -> None:
@@ -70,8 +95,7 @@ async def test_media_player_volume_level(
     assert player.volume_level == pytest.approx(0.5, rel=0.01)
 
 
-async def test_media_player_source(
-    hass: HomeAssistant,
+def test_media_player_source(
     mock_config_entry,
     mock_coordinator,
 ) -> None:
@@ -83,8 +107,7 @@ async def test_media_player_source(
     assert player.source == "Test Station"
 
 
-async def test_media_player_source_list(
-    hass: HomeAssistant,
+def test_media_player_source_list(
     mock_config_entry,
     mock_coordinator,
     mock_station_data,
@@ -95,10 +118,14 @@ async def test_media_player_source_list(
     player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
     
     assert player.source_list == ["Test Station 1", "Test Station 2", "QuickMix"]
+    # Reused until the stations list is replaced
+    assert player.source_list is player.source_list
+
+    mock_coordinator.data["stations"] = mock_station_data[:1]
+    assert player.source_list == ["Test Station 1"]
 
 
-async def test_media_player_media_attributes(
-    hass: HomeAssistant,
+def test_media_player_media_attributes(
     mock_config_entry,
     mock_coordinator,
     mock_song_data,
@@ -122,14 +149,12 @@ async def test_media_player_media_attributes(
 
 
 async def test_media_player_select_source(
-    hass: HomeAssistant,
     mock_config_entry,
     mock_coordinator,
     mock_station_data,
 ) -> None:
     """Test selecting a source."""
     mock_coordinator.data = {"stations": mock_station_data}
-    mock_coordinator.send_event = AsyncMock()
     
     player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
     
@@ -138,169 +163,82 @@ async def test_media_player_select_source(
     mock_coordinator.send_event.assert_called_once_with("station.change", "123456789")
 
 
-async def test_media_player_play(
-    hass: HomeAssistant,
-    mock_config_entry,
+@pytest.mark.parametrize(
+    ("method", "action"),
+    [
+        pytest.param("async_media_play", "playback.play", id="play"),
+        pytest.param("async_media_pause", "playback.pause", id="pause"),
+        pytest.param("async_media_next_track", "playback.next", id="next-track"),
+        pytest.param("async_volume_up", "volume.up", id="volume-up"),
+        pytest.param("async_volume_down", "volume.down", id="volume-down"),
+    ],
+)
+async def test_media_player_commands(
+    player: PianobarMediaPlayer,
     mock_coordinator,
+    method: str,
+    action: str,
 ) -> None:
-    """Test play command."""
-    mock_coordinator.send_action = AsyncMock()
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    await player.async_media_play()
-    
-    mock_coordinator.send_action.assert_called_once_with("playback.play")
+    """Test commands that send a bare action."""
+    await getattr(player, method)()
 
-
-async def test_media_player_pause(
-    hass: HomeAssistant,
-    mock_config_entry,
-    mock_coordinator,
-) -> None:
-    """Test pause command."""
-    mock_coordinator.send_action = AsyncMock()
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    await player.async_media_pause()
-    
-    mock_coordinator.send_action.assert_called_once_with("playback.pause")
-
-
-async def test_media_player_next_track(
-    hass: HomeAssistant,
-    mock_config_entry,
-    mock_coordinator,
-) -> None:
-    """Test next track command."""
-    mock_coordinator.send_action = AsyncMock()
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    await player.async_media_next_track()
-    
-    mock_coordinator.send_action.assert_called_once_with("playback.next")
+    mock_coordinator.send_action.assert_called_once_with(action)
 
 
+@pytest.mark.parametrize(
+    ("volume_level", "percent"),
+    [(0.0, 0.0), (0.5, 50.0), (0.75, 75.0), (1.0, 100.0)],
+)
 async def test_media_player_set_volume(
-    hass: HomeAssistant,
     mock_config_entry,
     mock_coordinator,
+    volume_level: float,
+    percent: float,
 ) -> None:
-    """Test set volume command."""
+    """Test set volume sends the level as a 0-100 percentage."""
     mock_coordinator.data = {"maxGain": 10}
-    mock_coordinator.send_action_with_params = AsyncMock()
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    await player.async_set_volume_level(0.75)
-    
-    mock_coordinator.send_action_with_params.assert_called_once()
-    call_args = mock_coordinator.send_action_with_params.call_args
-    assert call_args[0][0] == "volume.set"
-    assert call_args[0][1]["volume"] == 75.0
-
 
-async def test_media_player_volume_up(
-    hass: HomeAssistant,
-    mock_config_entry,
-    mock_coordinator,
-) -> None:
-    """Test volume up command."""
-    mock_coordinator.send_action = AsyncMock()
-    
     player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    await player.async_volume_up()
-    
-    mock_coordinator.send_action.assert_called_once_with("volume.up")
 
+    await player.async_set_volume_level(volume_level)
 
-async def test_media_player_volume_down(
-    hass: HomeAssistant,
-    mock_config_entry,
-    mock_coordinator,
-) -> None:
-    """Test volume down command."""
-    mock_coordinator.send_action = AsyncMock()
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    await player.async_volume_down()
-    
-    mock_coordinator.send_action.assert_called_once_with("volume.down")
+    mock_coordinator.send_action_with_params.assert_called_once()
+    call_args = mock_coordinator.send_action_with_params.call_args
+    assert call_args[0][0] == "volume.set"
+    assert call_args[0][1]["volume"] == pytest.approx(percent)
 
 
-async def test_media_player_play_media_by_id(
-    hass: HomeAssistant,
+@pytest.mark.parametrize(
+    ("media_type", "media_id", "station_id"),
+    [
+        pytest.param(MEDIA_TYPE_STATION, "123456789", "123456789", id="by-id"),
+        pytest.param(MediaType.MUSIC, "Test Station 2", "987654321", id="by-name"),
+    ],
+)
+async def test_media_player_play_media(
     mock_config_entry,
     mock_coordinator,
     mock_station_data,
+    media_type: str,
+    media_id: str,
+    station_id: str,
 ) -> None:
-    """Test play media by station ID."""
+    """Test play media resolves a station by ID or by name."""
     mock_coordinator.data = {"stations": mock_station_data}
-    mock_coordinator.send_event = AsyncMock()
-    
+
     player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    await player.async_play_media(MEDIA_TYPE_STATION, "123456789")
-    
-    mock_coordinator.send_event.assert_called_once_with("station.change", "123456789")
 
+    await player.async_play_media(media_type, media_id)
 
-async def test_media_player_play_media_by_name(
-    hass: HomeAssistant,
-    mock_config_entry,
-    mock_coordinator,
-    mock_station_data,
-) -> None:
-    """Test play media by station name."""
-    mock_coordinator.data = {"stations": mock_station_data}
-    mock_coordinator.send_event = AsyncMock()
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    await player.async_play_media(MediaType.MUSIC, "Test Station 2")
-    
-    mock_coordinator.send_event.assert_called_once_with("station.change", "987654321")
+    mock_coordinator.send_event.assert_called_once_with("station.change", station_id)
 
 
-async def test_media_player_supported_features(
-    hass: HomeAssistant,
-    mock_config_entry,
-    mock_coordinator,
-) -> None:
+def test_media_player_supported_features(player: PianobarMediaPlayer) -> None:
     """Test supported features."""
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    features = player.supported_features
-    
-    assert features & MediaPlayerEntityFeature.PAUSE
-    assert features & MediaPlayerEntityFeature.PLAY
-    assert features & MediaPlayerEntityFeature.VOLUME_SET
-    assert features & MediaPlayerEntityFeature.VOLUME_STEP
-    assert features & MediaPlayerEntityFeature.NEXT_TRACK
-    assert features & MediaPlayerEntityFeature.SELECT_SOURCE
-    assert features & MediaPlayerEntityFeature.BROWSE_MEDIA
-    assert features & MediaPlayerEntityFeature.PLAY_MEDIA
-
-
-async def test_media_player_state_off(
-    hass: HomeAssistant,
-    mock_config_entry,
-    mock_coordinator,
-) -> None:
-    """Test media player state OFF when no station."""
-    mock_coordinator.data = {"playing": False, "paused": False, "station": ""}
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
-    
-    assert player.state == MediaPlayerState.OFF
+    assert player.supported_features & EXPECTED_FEATURES == EXPECTED_FEATURES
 
 
-async def test_media_player_extra_state_attributes_no_song(
-    hass: HomeAssistant,
+def test_media_player_extra_state_attributes_no_song(
     mock_config_entry,
     mock_coordinator,
     mock_station_data,
@@ -322,8 +260,7 @@ async def test_media_player_extra_state_attributes_no_song(
     assert attrs["pandora_connected"] is True
 
 
-async def test_media_player_extra_state_attributes_with_song(
-    hass: HomeAssistant,
+def test_media_player_extra_state_attributes_with_song(
     mock_config_entry,
     mock_coordinator,
     mock_song_data,
@@ -342,14 +279,12 @@ async def test_media_player_extra_state_attributes_with_song(
 
 
 async def test_media_player_turn_on_connected(
-    hass: HomeAssistant,
     mock_config_entry,
     mock_coordinator,
 ) -> None:
     """Test turn on when already connected calls pandora-reconnect only."""
     mock_coordinator.data = {"station": "Test"}
     mock_coordinator.is_connected = True
-    mock_coordinator.send_action = AsyncMock()
     
     player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
     await player.async_turn_on()
@@ -358,15 +293,12 @@ async def test_media_player_turn_on_connected(
 
 
 async def test_media_player_turn_on_disconnected(
-    hass: HomeAssistant,
     mock_config_entry,
     mock_coordinator,
 ) -> None:
     """Test turn on when disconnected calls async_connect then pandora-reconnect."""
     mock_coordinator.data = {"station": ""}
     mock_coordinator.is_connected = False
-    mock_coordinator.async_connect = AsyncMock()
-    mock_coordinator.send_action = AsyncMock()
     
     player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
     await player.async_turn_on()
@@ -376,28 +308,22 @@ async def test_media_player_turn_on_disconnected(
 
 
 async def test_media_player_turn_off(
-    hass: HomeAssistant,
-    mock_config_entry,
+    player: PianobarMediaPlayer,
     mock_coordinator,
 ) -> None:
     """Test turn off calls pandora-disconnect."""
-    mock_coordinator.send_action = AsyncMock()
-    
-    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
     await player.async_turn_off()
     
     mock_coordinator.send_action.assert_called_once_with("app.pandora-disconnect")
 
 
 async def test_media_player_toggle_when_off(
-    hass: HomeAssistant,
     mock_config_entry,
     mock_coordinator,
 ) -> None:
     """Test toggle when state is OFF calls turn on (reconnect)."""
     mock_coordinator.data = {"station": ""}
     mock_coordinator.is_connected = True
-    mock_coordinator.send_action = AsyncMock()
     
     player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
     await player.async_toggle()
@@ -406,16 +332,52 @@ async def test_media_player_toggle_when_off(
 
 
 async def test_media_player_toggle_when_playing(
-    hass: HomeAssistant,
     mock_config_entry,
     mock_coordinator,
 ) -> None:
     """Test toggle when state is not OFF calls turn off (disconnect)."""
     mock_coordinator.data = {"playing": True, "paused": False, "station": "Test"}
-    mock_coordinator.send_action = AsyncMock()
     
     player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
     await player.async_toggle()
     
     mock_coordinator.send_action.assert_called_once_with("app.pandora-disconnect")
 
+
+def test_media_player_song_refreshed_on_coordinator_update(
+    mock_config_entry,
+    mock_coordinator,
+    mock_song_data,
+) -> None:
+    """Test song attributes follow the coordinator after an update."""
+    mock_coordinator.data = {"playing": False}
+
+    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
+    player.async_write_ha_state = MagicMock()
+    assert player.media_title is None
+
+    mock_coordinator.data["song"] = mock_song_data
+    player._handle_coordinator_update()
+
+    assert player.media_title == "Test Song"
+    assert player.media_artist == "Test Artist"
+    player.async_write_ha_state.assert_called_once()
+
+
+def test_media_player_coordinator_update_skips_unchanged_state(
+    mock_config_entry,
+    mock_coordinator,
+) -> None:
+    """Test no state write when nothing visible changed."""
+    mock_coordinator.data = {"playing": True, "paused": False, "station": "Test"}
+
+    player = PianobarMediaPlayer(mock_coordinator, mock_config_entry)
+    player.async_write_ha_state = MagicMock()
+
+    player._handle_coordinator_update()
+    player._handle_coordinator_update()
+    assert player.async_write_ha_state.call_count == 1
+
+    mock_coordinator.data["paused"] = True
+    player._handle_coordinator_update()
+    assert player.async_write_ha_state.call_count == 2
@@ -1,12 +1,11 @@
 """Tests for Pianobar select platform."""
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
 
 from custom_components.pianobar.const import DOMAIN
@@ -16,6 +15,8 @@ from custom_components.pianobar.select import (
     async_setup_entry,
 )
 
+pytestmark = pytest.mark.unit
+
 
 def _attach_select_platform(entity: PianobarStationSelect | PianobarAccountSelect) -> None:
     """Provide platform_translations so translated entity names resolve in tests."""
@@ -31,10 +32,9 @@ def _attach_select_platform(entity: PianobarStationSelect | PianobarAccountSelec
 
 
 @pytest.fixture
-def mock_coordinator_for_select(mock_station_data):
-    """Create a mock coordinator for select tests."""
-    coordinator = MagicMock()
-    coordinator.data = {
+def mock_coordinator_for_select(mock_coordinator, mock_station_data):
+    """Shared mock coordinator, playing the first test station."""
+    mock_coordinator.data = {
         "playing": True,
         "paused": False,
         "volume": 0,
@@ -42,29 +42,18 @@ def mock_coordinator_for_select(mock_station_data):
         "stationId": "123456789",
         "stations": mock_station_data,
     }
-    coordinator.send_event = AsyncMock()
-    coordinator.async_add_listener = MagicMock(return_value=lambda: None)
-    return coordinator
-
-
-@pytest.fixture
-def mock_config_entry_for_select():
-    """Create a mock config entry for select tests."""
-    entry = MagicMock()
-    entry.entry_id = "test_entry_id"
-    entry.data = {CONF_HOST: "127.0.0.1", CONF_PORT: 3000}
-    return entry
+    return mock_coordinator
 
 
 class TestPianobarStationSelect:
     """Tests for PianobarStationSelect entity."""
 
     def test_entity_creation(
-        self, mock_coordinator_for_select, mock_config_entry_for_select
+        self, mock_coordinator_for_select, mock_config_entry
     ):
         """Test entity is created with correct attributes."""
         entity = PianobarStationSelect(
-            mock_coordinator_for_select, mock_config_entry_for_select
+            mock_coordinator_for_select, mock_config_entry
         )
         _attach_select_platform(entity)
 
@@ -73,11 +62,11 @@ class TestPianobarStationSelect:
         assert entity.unique_id == "test_entry_id_station_select"
 
     def test_options_populated_from_stations(
-        self, mock_coordinator_for_select, mock_config_entry_for_select, mock_station_data
+        self, mock_coordinator_for_select, mock_config_entry, mock_station_data
     ):
         """Test options are populated from station list."""
         entity = PianobarStationSelect(
-            mock_coordinator_for_select, mock_config_entry_for_select
+            mock_coordinator_for_select, mock_config_entry
         )
 
         options = entity.options
@@ -87,85 +76,62 @@ class TestPianobarStationSelect:
         assert "QuickMix" in options
 
     def test_options_empty_when_no_stations(
-        self, mock_coordinator_for_select, mock_config_entry_for_select
+        self, mock_coordinator_for_select, mock_config_entry
     ):
         """Test options are empty when no stations available."""
         mock_coordinator_for_select.data["stations"] = []
         entity = PianobarStationSelect(
-            mock_coordinator_for_select, mock_config_entry_for_select
+            mock_coordinator_for_select, mock_config_entry
         )
 
         assert entity.options == []
 
-    def test_current_option_reflects_current_station(
-        self, mock_coordinator_for_select, mock_config_entry_for_select
-    ):
-        """Test current_option returns the current station."""
-        entity = PianobarStationSelect(
-            mock_coordinator_for_select, mock_config_entry_for_select
-        )
-
-        assert entity.current_option == "Test Station 1"
-
-    def test_current_option_none_when_no_station(
-        self, mock_coordinator_for_select, mock_config_entry_for_select
-    ):
-        """Test current_option is None when no station selected."""
-        mock_coordinator_for_select.data["station"] = ""
-        entity = PianobarStationSelect(
-            mock_coordinator_for_select, mock_config_entry_for_select
-        )
-
-        assert entity.current_option is None
-
-    def test_current_option_none_when_station_not_in_options(
-        self, mock_coordinator_for_select, mock_config_entry_for_select
+    @pytest.mark.parametrize(
+        ("station", "expected"),
+        [
+            pytest.param("Test Station 1", "Test Station 1", id="match"),
+            pytest.param("", None, id="empty"),
+            pytest.param("Unknown Station", None, id="unknown"),
+        ],
+    )
+    def test_current_option(
+        self, mock_coordinator_for_select, mock_config_entry, station, expected
     ):
-        """Test current_option is None when station is not in options."""
-        mock_coordinator_for_select.data["station"] = "Unknown Station"
+        """Test current_option is the current station when it is an option."""
+        mock_coordinator_for_select.data["station"] = station
         entity = PianobarStationSelect(
-            mock_coordinator_for_select, mock_config_entry_for_select
+            mock_coordinator_for_select, mock_config_entry
         )
 
-        assert entity.current_option is None
+        assert entity.current_option == expected
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("option", "station_id"),
+        [
+            pytest.param("Test Station 2", "987654321", id="station"),
+            pytest.param("QuickMix", "555555555", id="quickmix"),
+        ],
+    )
     async def test_select_option_sends_station_change(
-        self, mock_coordinator_for_select, mock_config_entry_for_select
-    ):
-        """Test selecting an option sends station.change event."""
-        entity = PianobarStationSelect(
-            mock_coordinator_for_select, mock_config_entry_for_select
-        )
-
-        await entity.async_select_option("Test Station 2")
-
-        mock_coordinator_for_select.send_event.assert_called_once_with(
-            "station.change", "987654321"
-        )
-
-    @pytest.mark.asyncio
-    async def test_select_option_with_quickmix(
-        self, mock_coordinator_for_select, mock_config_entry_for_select
+        self, mock_coordinator_for_select, mock_config_entry, option, station_id
     ):
-        """Test selecting QuickMix sends correct station ID."""
+        """Test selecting an option sends station.change with its ID."""
         entity = PianobarStationSelect(
-            mock_coordinator_for_select, mock_config_entry_for_select
+            mock_coordinator_for_select, mock_config_entry
         )
 
-        await entity.async_select_option("QuickMix")
+        await entity.async_select_option(option)
 
         mock_coordinator_for_select.send_event.assert_called_once_with(
-            "station.change", "555555555"
+            "station.change", station_id
         )
 
-    @pytest.mark.asyncio
     async def test_select_unknown_option_does_nothing(
-        self, mock_coordinator_for_select, mock_config_entry_for_select
+        self, mock_coordinator_for_select, mock_config_entry
     ):
         """Test selecting unknown option does not send event."""
         entity = PianobarStationSelect(
-            mock_coordinator_for_select, mock_config_entry_for_select
+            mock_coordinator_for_select, mock_config_entry
         )
 
         await entity.async_select_option("Non-existent Station")
@@ -173,11 +139,11 @@ class TestPianobarStationSelect:
         mock_coordinator_for_select.send_event.assert_not_called()
 
     def test_device_info(
-        self, mock_coordinator_for_select, mock_config_entry_for_select
+        self, mock_coordinator_for_select, mock_config_entry
     ):
         """Test device info is set correctly."""
         entity = PianobarStationSelect(
-            mock_coordinator_for_select, mock_config_entry_for_select
+            mock_coordinator_for_select, mock_config_entry
         )
 
         assert entity.device_info == {
@@ -187,39 +153,47 @@ class TestPianobarStationSelect:
             "model": "Pianobar",
         }
 
+    def test_coordinator_update_skips_unchanged_state(
+        self, mock_coordinator_for_select, mock_config_entry
+    ):
+        """Test state is written only when the selection or options change."""
+        entity = PianobarStationSelect(
+            mock_coordinator_for_select, mock_config_entry
+        )
+        entity.async_write_ha_state = MagicMock()
+
+        entity._handle_coordinator_update()
+        entity._handle_coordinator_update()
+        assert entity.async_write_ha_state.call_count == 1
+
+        mock_coordinator_for_select.data["station"] = "QuickMix"
+        entity._handle_coordinator_update()
+        assert entity.async_write_ha_state.call_count == 2
+
 
 @pytest.fixture
-def mock_coordinator_multi_account(mock_station_data):
+def mock_coordinator_multi_account(mock_coordinator_for_select):
     """Coordinator data with two accounts (multi-account UI)."""
-    coordinator = MagicMock()
-    coordinator.data = {
-        "playing": True,
-        "paused": False,
-        "volume": 0,
-        "station": "Test Station 1",
-        "stationId": "123456789",
-        "stations": mock_station_data,
-        "accounts": [
-            {"id": "work", "label": "Work"},
-            {"id": "home", "label": "Home"},
-        ],
-        "current_account": {"id": "work", "label": "Work"},
+    mock_coordinator_for_select.data["accounts"] = [
+        {"id": "work", "label": "Work"},
+        {"id": "home", "label": "Home"},
+    ]
+    mock_coordinator_for_select.data["current_account"] = {
+        "id": "work",
+        "label": "Work",
     }
-    coordinator.send_event = AsyncMock()
-    coordinator.send_action_with_params = AsyncMock()
-    coordinator.async_add_listener = MagicMock(return_value=lambda: None)
-    return coordinator
+    return mock_coordinator_for_select
 
 
 class TestPianobarAccountSelect:
     """Tests for PianobarAccountSelect entity."""
 
     def test_account_entity_attributes(
-        self, mock_coordinator_multi_account, mock_config_entry_for_select
+        self, mock_coordinator_multi_account, mock_config_entry
     ):
         """Account select uses correct name, icon, unique_id."""
         entity = PianobarAccountSelect(
-            mock_coordinator_multi_account, mock_config_entry_for_select
+            mock_coordinator_multi_account, mock_config_entry
         )
         _attach_select_platform(entity)
         assert entity.name == "Account"
@@ -227,17 +201,17 @@ class TestPianobarAccountSelect:
         assert entity.unique_id == "test_entry_id_account_select"
 
     def test_account_options_and_current(
-        self, mock_coordinator_multi_account, mock_config_entry_for_select
+        self, mock_coordinator_multi_account, mock_config_entry
     ):
         """Options list labels; current_option matches active account."""
         entity = PianobarAccountSelect(
-            mock_coordinator_multi_account, mock_config_entry_for_select
+            mock_coordinator_multi_account, mock_config_entry
         )
         assert entity.options == ["Work", "Home"]
         assert entity.current_option == "Work"
 
     def test_current_option_falls_back_to_id_when_no_label(
-        self, mock_coordinator_multi_account, mock_config_entry_for_select
+        self, mock_coordinator_multi_account, mock_config_entry
     ):
         """current_account without label uses id if that id is in options."""
         mock_coordinator_multi_account.data["accounts"] = [
@@ -245,12 +219,12 @@ class TestPianobarAccountSelect:
         ]
         mock_coordinator_multi_account.data["current_account"] = {"id": "solo"}
         entity = PianobarAccountSelect(
-            mock_coordinator_multi_account, mock_config_entry_for_select
+            mock_coordinator_multi_account, mock_config_entry
         )
         assert entity.current_option == "solo"
 
     def test_current_option_none_when_not_in_options(
-        self, mock_coordinator_multi_account, mock_config_entry_for_select
+        self, mock_coordinator_multi_account, mock_config_entry
     ):
         """Unknown active account label yields None."""
         mock_coordinator_multi_account.data["current_account"] = {
@@ -258,36 +232,33 @@ class TestPianobarAccountSelect:
             "label": "Ghost",
         }
         entity = PianobarAccountSelect(
-            mock_coordinator_multi_account, mock_config_entry_for_select
+            mock_coordinator_multi_account, mock_config_entry
         )
         assert entity.current_option is None
 
-    @pytest.mark.asyncio
     async def test_account_async_select_option(
-        self, mock_coordinator_multi_account, mock_config_entry_for_select
+        self, mock_coordinator_multi_account, mock_config_entry
     ):
         """Selecting an account sends app.pandora-reconnect with account_id."""
         entity = PianobarAccountSelect(
-            mock_coordinator_multi_account, mock_config_entry_for_select
+            mock_coordinator_multi_account, mock_config_entry
         )
         await entity.async_select_option("Home")
         mock_coordinator_multi_account.send_action_with_params.assert_called_once_with(
             "app.pandora-reconnect", {"account_id": "home"}
         )
 
-    @pytest.mark.asyncio
     async def test_account_async_select_unknown_option(
-        self, mock_coordinator_multi_account, mock_config_entry_for_select
+        self, mock_coordinator_multi_account, mock_config_entry
     ):
         """Unknown account label does not call send_action_with_params."""
         entity = PianobarAccountSelect(
-            mock_coordinator_multi_account, mock_config_entry_for_select
+            mock_coordinator_multi_account, mock_config_entry
         )
         await entity.async_select_option("Nope")
         mock_coordinator_multi_account.send_action_with_params.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_async_setup_entry_single_account_only_station_select(
     hass: HomeAssistant, mock_config_entry: ConfigEntry
 ):
@@ -309,7 +280,6 @@ async def test_async_setup_entry_single_account_only_station_select(
     assert isinstance(entities[0], PianobarStationSelect)
 
 
-@pytest.mark.asyncio
 async def test_async_setup_entry_multi_account_adds_account_select(
     hass: HomeAssistant, mock_config_entry: ConfigEntry
 ):